@@ -107,6 +107,15 @@ async def websocket_endpoint(websocket: WebSocket):
                     }
                 )
 
+            else:
+                # Answer explicitly so clients don't wait on a frame that never comes
+                await websocket.send_json(
+                    {
+                        "type": "error",
+                        "message": f"Unknown message type: {data['type']}",
+                    }
+                )
+
     except WebSocketDisconnect:
         chat_service = get_chat_service()
         await chat_service.disconnect(websocket)
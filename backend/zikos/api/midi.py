@@ -1,6 +1,6 @@
 """MIDI API endpoints"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
@@ -10,6 +10,11 @@ router = APIRouter()
 midi_service = MidiService()
 
 
+def get_midi_service() -> MidiService:
+    """Get the MidiService used by the endpoints (overridable in tests)"""
+    return midi_service
+
+
 class ValidateMidiRequest(BaseModel):
     """Request model for MIDI validation"""
 
@@ -17,7 +22,9 @@ class ValidateMidiRequest(BaseModel):
 
 
 @router.post("/validate")
-async def validate_midi(request: ValidateMidiRequest):
+async def validate_midi(
+    request: ValidateMidiRequest, midi_service: MidiService = Depends(get_midi_service)
+):
     """Validate MIDI text"""
     try:
         result = await midi_service.validate_midi(request.midi_text)
@@ -27,7 +34,11 @@ async def validate_midi(request: ValidateMidiRequest):
 
 
 @router.post("/{midi_file_id}/synthesize")
-async def synthesize_midi(midi_file_id: str, instrument: str = "piano"):
+async def synthesize_midi(
+    midi_file_id: str,
+    instrument: str = "piano",
+    midi_service: MidiService = Depends(get_midi_service),
+):
     """Synthesize MIDI to audio"""
     try:
         audio_file_id = await midi_service.synthesize(midi_file_id, instrument)
@@ -37,7 +48,11 @@ async def synthesize_midi(midi_file_id: str, instrument: str = "piano"):
 
 
 @router.post("/{midi_file_id}/render")
-async def render_notation(midi_file_id: str, format: str = "both"):
+async def render_notation(
+    midi_file_id: str,
+    format: str = "both",
+    midi_service: MidiService = Depends(get_midi_service),
+):
     """Render MIDI to notation"""
     try:
         result = await midi_service.render_notation(midi_file_id, format)
@@ -47,7 +62,7 @@ async def render_notation(midi_file_id: str, format: str = "both"):
 
 
 @router.get("/{midi_file_id}")
-async def get_midi_file(midi_file_id: str):
+async def get_midi_file(midi_file_id: str, midi_service: MidiService = Depends(get_midi_service)):
     """Get MIDI file"""
     try:
         file_path = await midi_service.get_midi_path(midi_file_id)
@@ -28,6 +28,12 @@ class Settings(BaseModel):
     llm_tool_format: str = "auto"  # auto, qwen, simplified, native
     llm_n_ctx: int | None = None
     llm_n_gpu_layers: int = LLMConstants.DEFAULT_N_GPU_LAYERS
+    llm_n_batch: int = LLMConstants.DEFAULT_N_BATCH
+    llm_n_ubatch: int = LLMConstants.DEFAULT_N_UBATCH
+    llm_n_threads: int | None = None  # None = number of physical cores
+    llm_use_mlock: bool = False
+    llm_flash_attn: bool = True
+    llm_kv_cache_type: str = "q8_0"  # "" = llama.cpp default (f16)
     llm_temperature: float = LLMConstants.DEFAULT_TEMPERATURE
     llm_top_p: float = LLMConstants.DEFAULT_TOP_P
     llm_top_k: int = LLMConstants.DEFAULT_TOP_K
@@ -81,6 +87,14 @@ class Settings(BaseModel):
             llm_tool_format=os.getenv("LLM_TOOL_FORMAT", defaults.llm_tool_format),
             llm_n_ctx=cls._parse_optional_int("LLM_N_CTX"),
             llm_n_gpu_layers=int(os.getenv("LLM_N_GPU_LAYERS", str(defaults.llm_n_gpu_layers))),
+            llm_n_batch=int(os.getenv("LLM_N_BATCH", str(defaults.llm_n_batch))),
+            llm_n_ubatch=int(os.getenv("LLM_N_UBATCH", str(defaults.llm_n_ubatch))),
+            llm_n_threads=cls._parse_optional_int("LLM_N_THREADS"),
+            llm_use_mlock=os.getenv("LLM_USE_MLOCK", str(defaults.llm_use_mlock).lower()).lower()
+            == "true",
+            llm_flash_attn=os.getenv("LLM_FLASH_ATTN", str(defaults.llm_flash_attn).lower()).lower()
+            == "true",
+            llm_kv_cache_type=os.getenv("LLM_KV_CACHE_TYPE", defaults.llm_kv_cache_type),
             llm_temperature=float(os.getenv("LLM_TEMPERATURE", str(defaults.llm_temperature))),
             llm_top_p=float(os.getenv("LLM_TOP_P", str(defaults.llm_top_p))),
             llm_top_k=int(os.getenv("LLM_TOP_K", str(defaults.llm_top_k))),
@@ -27,12 +27,19 @@ class LLMConstants:
     MIN_UNIQUE_WORD_RATIO: float = 0.15
     MAX_SINGLE_CHAR_RATIO: float = 0.3
 
+    # Stored conversation bounds (per-request truncation is done by MessagePreparer)
+    MAX_HISTORY_MESSAGES: int = 100
+    MAX_HISTORY_CHARS: int = 200000
+    CONVERSATION_TTL_SECONDS: float = 6 * 3600
+
     # Default max_tokens for _prepare_messages (legacy, can be overridden)
     DEFAULT_MAX_TOKENS: int = 3000
 
     # LLM configuration defaults
     DEFAULT_N_CTX: int = 32768
     DEFAULT_N_GPU_LAYERS: int = -1
+    DEFAULT_N_BATCH: int = 512
+    DEFAULT_N_UBATCH: int = 512
     DEFAULT_TEMPERATURE: float = 0.7
     DEFAULT_TOP_P: float = 0.9
     DEFAULT_TOP_K: int = 40
@@ -17,6 +17,12 @@ class ToolCategory(Enum):
     OTHER = "other"
 
 
+# Tools handled by the frontend: calling one pauses the tool loop and hands off to the UI
+FRONTEND_TOOL_CATEGORIES = frozenset(
+    {ToolCategory.DISPLAY_WIDGET, ToolCategory.INTERACTION_REQUEST}
+)
+
+
 @dataclass
 class Tool:
     """Represents a single tool with its metadata and schema"""
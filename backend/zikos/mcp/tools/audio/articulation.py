@@ -6,6 +6,7 @@ import librosa
 import numpy as np
 
 from zikos.mcp.tool import Tool, ToolCategory
+from zikos.mcp.tools.audio.utils import load_audio
 
 
 def get_analyze_articulation_tool() -> Tool:
@@ -35,7 +36,7 @@ Interpretation Guidelines:
 async def analyze_articulation(audio_path: str) -> dict[str, Any]:
     """Analyze articulation types (staccato, legato, etc.)"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
 
         if len(y) / sr < 0.5:
             return {
@@ -1,5 +1,6 @@
 """Main audio analysis tools class"""
 
+from pathlib import Path
 from typing import Any
 
 from zikos.mcp.tool import Tool, ToolCategory
@@ -68,7 +69,7 @@ class AudioAnalysisTools(ToolCollection):
                 required=["audio_file_id"],
                 detailed_description="""Get basic audio file metadata.
 
-Returns: dict with duration (seconds), sample_rate (Hz), channels (1=mono, 2=stereo), format (file format), file_size_bytes
+Returns: dict with duration (seconds), sample_rate (Hz), channels (1=mono, 2=stereo), frames (samples per channel), format (file format), file_size_bytes
 
 Interpretation Guidelines:
 - duration: Length of audio in seconds - use to check if recording is complete
@@ -416,13 +417,15 @@ Interpretation Guidelines:
                     ),
                 }
 
+            # sf.info parses only the file header, so no samples are decoded here
             info = sf.info(resolved_path)
             return {
                 "duration": info.duration,
                 "sample_rate": info.samplerate,
                 "channels": info.channels,
+                "frames": info.frames,
                 "format": info.format,
-                "file_size_bytes": info.frames * info.channels * info.samplerate,
+                "file_size_bytes": Path(resolved_path).stat().st_size,
             }
         except FileNotFoundError:
             ref = audio_file_id or audio_path or "unknown"
@@ -6,6 +6,7 @@ import librosa
 import numpy as np
 
 from zikos.mcp.tool import Tool, ToolCategory
+from zikos.mcp.tools.audio.utils import load_audio
 
 
 def get_detect_chords_tool() -> Tool:
@@ -63,7 +64,7 @@ def chroma_to_chord(chroma: np.ndarray) -> tuple[str, float]:
 async def detect_chords(audio_path: str) -> dict[str, Any]:
     """Detect chord progression"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
 
         if len(y) / sr < 0.5:
             return {
@@ -8,6 +8,7 @@ import soundfile as sf
 
 from zikos.constants import AUDIO
 from zikos.mcp.tool import Tool, ToolCategory
+from zikos.mcp.tools.audio.utils import load_audio
 
 
 def get_analyze_dynamics_tool() -> Tool:
@@ -34,7 +35,7 @@ Interpretation Guidelines:
 async def analyze_dynamics(audio_path: str) -> dict[str, Any]:
     """Analyze amplitude and dynamic range"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
 
         if len(y) / sr < AUDIO.MIN_AUDIO_DURATION:
             return {
@@ -6,7 +6,7 @@ import librosa
 import numpy as np
 
 from zikos.mcp.tool import Tool, ToolCategory
-from zikos.mcp.tools.audio.utils import resolve_audio_path
+from zikos.mcp.tools.audio.utils import load_audio, resolve_audio_path
 
 
 def get_analyze_groove_tool() -> Tool:
@@ -35,7 +35,7 @@ Interpretation Guidelines:
 async def analyze_groove(audio_path: str) -> dict[str, Any]:
     """Analyze microtiming patterns and groove"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
 
         if len(y) / sr < 0.5:
             return {
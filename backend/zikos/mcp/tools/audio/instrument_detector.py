@@ -5,6 +5,8 @@ from typing import Any
 import librosa
 import numpy as np
 
+from zikos.mcp.tools.audio.utils import load_audio
+
 
 async def detect_instrument(audio_path: str) -> dict[str, Any]:
     """Return instrument-discriminating metrics.
@@ -19,8 +21,25 @@ async def detect_instrument(audio_path: str) -> dict[str, Any]:
     and flag any mismatch before giving feedback.
     """
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
+    except FileNotFoundError:
+        return {
+            "error": True,
+            "error_type": "FILE_NOT_FOUND",
+            "message": f"Audio file not found: {audio_path}",
+        }
+    except Exception as e:
+        return {
+            "error": True,
+            "error_type": "PROCESSING_FAILED",
+            "message": f"Instrument metrics failed: {str(e)}",
+        }
+    return detect_instrument_array(y, sr)
+
 
+def detect_instrument_array(y: np.ndarray, sr: float) -> dict[str, Any]:
+    """Return instrument-discriminating metrics for already-loaded mono audio"""
+    try:
         centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
         mean_centroid = float(np.mean(centroid))
 
@@ -46,12 +65,6 @@ async def detect_instrument(audio_path: str) -> dict[str, Any]:
             "pitch_confidence": round(pitch_confidence, 3),
             "harmonic_ratio": round(harmonic_ratio, 3),
         }
-    except FileNotFoundError:
-        return {
-            "error": True,
-            "error_type": "FILE_NOT_FOUND",
-            "message": f"Audio file not found: {audio_path}",
-        }
     except Exception as e:
         return {
             "error": True,
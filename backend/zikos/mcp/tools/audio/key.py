@@ -6,6 +6,7 @@ import librosa
 import numpy as np
 
 from zikos.mcp.tool import Tool, ToolCategory
+from zikos.mcp.tools.audio.utils import load_audio
 
 
 def get_detect_key_tool() -> Tool:
@@ -38,7 +39,7 @@ Interpretation Guidelines:
 async def detect_key(audio_path: str) -> dict[str, Any]:
     """Detect musical key"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
 
         if len(y) / sr < 0.5:
             return {
@@ -6,7 +6,7 @@ import librosa
 import numpy as np
 
 from zikos.mcp.tool import Tool, ToolCategory
-from zikos.mcp.tools.audio.utils import resolve_audio_path
+from zikos.mcp.tools.audio.utils import load_audio, resolve_audio_path
 
 
 def get_segment_phrases_tool() -> Tool:
@@ -40,7 +40,7 @@ Interpretation Guidelines:
 async def segment_phrases(audio_path: str) -> dict[str, Any]:
     """Detect musical phrase boundaries"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
 
         if len(y) / sr < 0.5:
             return {
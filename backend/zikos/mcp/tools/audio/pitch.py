@@ -6,6 +6,7 @@ import librosa
 import numpy as np
 
 from zikos.mcp.tool import Tool, ToolCategory
+from zikos.mcp.tools.audio.utils import load_audio
 
 
 def get_detect_pitch_tool() -> Tool:
@@ -82,8 +83,25 @@ def calculate_intonation_accuracy(frequencies: np.ndarray, reference_freq: float
 async def detect_pitch(audio_path: str) -> dict[str, Any]:
     """Detect pitch and notes with intonation analysis"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
+    except FileNotFoundError:
+        return {
+            "error": True,
+            "error_type": "FILE_NOT_FOUND",
+            "message": f"Audio file not found: {audio_path}",
+        }
+    except Exception as e:
+        return {
+            "error": True,
+            "error_type": "PROCESSING_FAILED",
+            "message": f"Pitch detection failed: {str(e)}",
+        }
+    return detect_pitch_array(y, sr)
+
 
+def detect_pitch_array(y: np.ndarray, sr: float) -> dict[str, Any]:
+    """Detect pitch and notes with intonation analysis on already-loaded mono audio"""
+    try:
         if len(y) / sr < 0.5:
             return {
                 "error": True,
@@ -195,12 +213,6 @@ async def detect_pitch(audio_path: str) -> dict[str, Any]:
             "sharp_tendency": float(sharp_tendency),
             "flat_tendency": float(flat_tendency),
         }
-    except FileNotFoundError:
-        return {
-            "error": True,
-            "error_type": "FILE_NOT_FOUND",
-            "message": f"Audio file not found: {audio_path}",
-        }
     except Exception as e:
         return {
             "error": True,
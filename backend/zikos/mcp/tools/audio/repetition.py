@@ -6,7 +6,7 @@ import librosa
 import numpy as np
 
 from zikos.mcp.tool import Tool, ToolCategory
-from zikos.mcp.tools.audio.utils import resolve_audio_path
+from zikos.mcp.tools.audio.utils import load_audio, resolve_audio_path
 
 
 def get_detect_repetitions_tool() -> Tool:
@@ -38,7 +38,7 @@ Interpretation Guidelines:
 async def detect_repetitions(audio_path: str) -> dict[str, Any]:
     """Detect repeated patterns in audio"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
 
         if len(y) / sr < 2.0:
             return {
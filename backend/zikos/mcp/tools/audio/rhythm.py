@@ -6,6 +6,7 @@ import librosa
 import numpy as np
 
 from zikos.mcp.tool import Tool, ToolCategory
+from zikos.mcp.tools.audio.utils import load_audio
 
 # Finer hop gives ~2.9ms resolution at 44100 Hz, preventing the 11.6ms quantization
 # artifact where on-beat notes appear as "minor" deviations instead of being filtered out.
@@ -62,8 +63,25 @@ def calculate_timing_accuracy(onset_times: np.ndarray, beat_times: np.ndarray) -
 async def analyze_rhythm(audio_path: str) -> dict[str, Any]:
     """Analyze rhythm and timing"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
+    except FileNotFoundError:
+        return {
+            "error": True,
+            "error_type": "FILE_NOT_FOUND",
+            "message": f"Audio file not found: {audio_path}",
+        }
+    except Exception as e:
+        return {
+            "error": True,
+            "error_type": "PROCESSING_FAILED",
+            "message": f"Rhythm analysis failed: {str(e)}",
+        }
+    return analyze_rhythm_array(y, sr)
+
 
+def analyze_rhythm_array(y: np.ndarray, sr: float) -> dict[str, Any]:
+    """Analyze rhythm and timing of already-loaded mono audio"""
+    try:
         if len(y) / sr < 0.5:
             return {
                 "error": True,
@@ -150,12 +168,6 @@ async def analyze_rhythm(audio_path: str) -> dict[str, Any]:
             "rushing_tendency": float(rushing_tendency),
             "dragging_tendency": float(dragging_tendency),
         }
-    except FileNotFoundError:
-        return {
-            "error": True,
-            "error_type": "FILE_NOT_FOUND",
-            "message": f"Audio file not found: {audio_path}",
-        }
     except Exception as e:
         return {
             "error": True,
@@ -7,6 +7,7 @@ import numpy as np
 
 from zikos.constants import AUDIO
 from zikos.mcp.tool import Tool, ToolCategory
+from zikos.mcp.tools.audio.utils import load_audio
 
 
 def get_analyze_tempo_tool() -> Tool:
@@ -33,8 +34,25 @@ Interpretation Guidelines:
 async def analyze_tempo(audio_path: str) -> dict[str, Any]:
     """Analyze tempo/BPM and timing consistency"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
+    except FileNotFoundError:
+        return {
+            "error": True,
+            "error_type": "FILE_NOT_FOUND",
+            "message": f"Audio file not found: {audio_path}",
+        }
+    except Exception as e:
+        return {
+            "error": True,
+            "error_type": "PROCESSING_FAILED",
+            "message": f"Tempo analysis failed: {str(e)}",
+        }
+    return analyze_tempo_array(y, sr)
+
 
+def analyze_tempo_array(y: np.ndarray, sr: float) -> dict[str, Any]:
+    """Analyze tempo/BPM and timing consistency of already-loaded mono audio"""
+    try:
         if len(y) / sr < AUDIO.MIN_AUDIO_DURATION:
             return {
                 "error": True,
@@ -89,12 +107,6 @@ async def analyze_tempo(audio_path: str) -> dict[str, Any]:
             "tempo_changes": tempo_changes,
             "mean_inter_beat_interval_ms": mean_inter_beat_interval_ms,
         }
-    except FileNotFoundError:
-        return {
-            "error": True,
-            "error_type": "FILE_NOT_FOUND",
-            "message": f"Audio file not found: {audio_path}",
-        }
     except Exception as e:
         return {
             "error": True,
@@ -7,6 +7,7 @@ import numpy as np
 
 from zikos.constants import AUDIO
 from zikos.mcp.tool import Tool, ToolCategory
+from zikos.mcp.tools.audio.utils import load_audio
 
 
 def get_analyze_timbre_tool() -> Tool:
@@ -40,8 +41,25 @@ Interpretation Guidelines:
 async def analyze_timbre(audio_path: str) -> dict[str, Any]:
     """Analyze timbre and spectral characteristics"""
     try:
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = load_audio(audio_path)
+    except FileNotFoundError:
+        return {
+            "error": True,
+            "error_type": "FILE_NOT_FOUND",
+            "message": f"Audio file not found: {audio_path}",
+        }
+    except Exception as e:
+        return {
+            "error": True,
+            "error_type": "PROCESSING_FAILED",
+            "message": f"Timbre analysis failed: {str(e)}",
+        }
+    return analyze_timbre_array(y, sr)
 
+
+def analyze_timbre_array(y: np.ndarray, sr: float) -> dict[str, Any]:
+    """Analyze timbre and spectral characteristics of already-loaded mono audio"""
+    try:
         if len(y) / sr < AUDIO.MIN_AUDIO_DURATION:
             return {
                 "error": True,
@@ -49,15 +67,18 @@ async def analyze_timbre(audio_path: str) -> dict[str, Any]:
                 "message": f"Audio is too short (minimum {AUDIO.MIN_AUDIO_DURATION} seconds required)",
             }
 
-        spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-        spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)[0]
-        spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr)[0]
-
-        mean_centroid = float(np.mean(spectral_centroids))
-        mean_rolloff = float(np.mean(spectral_rolloff))
-        mean_bandwidth = float(np.mean(spectral_bandwidth))
+        # The three spectral features share framing, so stack them and reduce in one pass
+        feats = np.stack(
+            [
+                librosa.feature.spectral_centroid(y=y, sr=sr)[0],
+                librosa.feature.spectral_rolloff(y=y, sr=sr)[0],
+                librosa.feature.spectral_bandwidth(y=y, sr=sr)[0],
+            ]
+        )
+        mean_centroid, mean_rolloff, mean_bandwidth = feats.mean(axis=1).tolist()
+        centroid_std = feats[0].std().item()
 
-        brightness = float(min(1.0, mean_centroid / AUDIO.BRIGHTNESS_DIVISOR))
+        brightness = min(1.0, mean_centroid / AUDIO.BRIGHTNESS_DIVISOR)
 
         stft = librosa.stft(y, n_fft=AUDIO.STFT_N_FFT)
         magnitude = np.abs(stft)
@@ -66,25 +87,16 @@ async def analyze_timbre(audio_path: str) -> dict[str, Any]:
         low_freq_mask = freqs < AUDIO.LOW_FREQ_THRESHOLD
         high_freq_mask = freqs >= AUDIO.HIGH_FREQ_THRESHOLD
 
-        low_freq_sum = np.sum(magnitude[low_freq_mask, :])
-        high_freq_sum = np.sum(magnitude[high_freq_mask, :])
-        low_freq_energy = float(
-            low_freq_sum.item() if hasattr(low_freq_sum, "item") else low_freq_sum
-        )
-        high_freq_energy = float(
-            high_freq_sum.item() if hasattr(high_freq_sum, "item") else high_freq_sum
-        )
+        low_freq_energy = magnitude[low_freq_mask, :].sum().item()
+        high_freq_energy = magnitude[high_freq_mask, :].sum().item()
         total_energy = low_freq_energy + high_freq_energy
 
-        if total_energy > 0:
-            warmth = float(low_freq_energy / total_energy)
-        else:
-            warmth = 0.5
+        warmth = low_freq_energy / total_energy if total_energy > 0 else 0.5
 
-        sharpness = float(min(1.0, mean_rolloff / AUDIO.SHARPNESS_DIVISOR))
+        sharpness = min(1.0, mean_rolloff / AUDIO.SHARPNESS_DIVISOR)
 
-        centroid_std = float(np.std(spectral_centroids))
-        timbre_consistency = float(1.0 / (1.0 + centroid_std / AUDIO.TIMBRE_CONSISTENCY_DIVISOR))
+        timbre_consistency = 1.0 / (1.0 + centroid_std / AUDIO.TIMBRE_CONSISTENCY_DIVISOR)
+        # Also maps a NaN from silent input to 1.0
         timbre_consistency = max(0.0, min(1.0, timbre_consistency))
 
         onsets = librosa.onset.onset_detect(y=y, sr=sr)
@@ -109,7 +121,7 @@ async def analyze_timbre(audio_path: str) -> dict[str, Any]:
             harmonic_energy = float(np.sum(harmonic**2))
             total_energy_hpss = float(np.sum(y**2))
             if total_energy_hpss > 0:
-                harmonic_ratio = float(harmonic_energy / total_energy_hpss)
+                harmonic_ratio = harmonic_energy / total_energy_hpss
         except Exception:
             pass
 
@@ -121,14 +133,8 @@ async def analyze_timbre(audio_path: str) -> dict[str, Any]:
             "spectral_rolloff": mean_rolloff,
             "spectral_bandwidth": mean_bandwidth,
             "timbre_consistency": timbre_consistency,
-            "attack_time": float(attack_time),
-            "harmonic_ratio": float(harmonic_ratio),
-        }
-    except FileNotFoundError:
-        return {
-            "error": True,
-            "error_type": "FILE_NOT_FOUND",
-            "message": f"Audio file not found: {audio_path}",
+            "attack_time": attack_time,
+            "harmonic_ratio": harmonic_ratio,
         }
     except Exception as e:
         return {
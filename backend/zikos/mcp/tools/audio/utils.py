@@ -3,6 +3,9 @@
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import soundfile as sf
+
 from zikos.config import settings
 
 
@@ -22,6 +25,29 @@ def resolve_audio_path(audio_file_id: str) -> Path:
     return file_path
 
 
+def load_audio(audio_path: str | Path) -> tuple[np.ndarray, int]:
+    """Load audio as mono float32 at its native sample rate
+
+    Decodes with libsndfile directly, which is much cheaper than librosa.load for
+    the WAVs we store. Formats libsndfile cannot read fall back to librosa.
+    """
+    path = Path(audio_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+    try:
+        y, sr = sf.read(str(path), dtype="float32", always_2d=False)
+    except RuntimeError:
+        import librosa
+
+        y, sr = librosa.load(str(path), sr=None)
+        return y, int(sr)
+
+    if y.ndim == 2:
+        y = y.mean(axis=1, dtype=np.float32)
+    return y, int(sr)
+
+
 def create_error_response(
     error_type: str,
     message: str,
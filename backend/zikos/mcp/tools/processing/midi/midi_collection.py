@@ -1,6 +1,8 @@
 """MIDI tools"""
 
+import asyncio
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,12 +12,90 @@ from zikos.mcp.tools.base import ToolCollection
 from zikos.mcp.tools.processing.midi.midi_parser import MidiParseError, midi_text_to_file
 
 
+@lru_cache(maxsize=32)
+def _parse_midi_stream(path_str: str, mtime_ns: int) -> Any:
+    """Parse a MIDI file into a music21 stream, memoized per (path, mtime)
+
+    music21 parsing dominates synthesis and notation time, and both tools are
+    usually called on the same file. mtime_ns is part of the key so a rewritten
+    file is parsed again. Every hit returns the same stream, so it is read-only:
+    only _note_events and _render_sheet_svg read it, and they cache what they derive.
+    """
+    from music21 import midi
+
+    return midi.translate.midiFilePathToStream(path_str)
+
+
+# (offset seconds, duration seconds, MIDI pitches, velocity) of one note or chord
+_NoteEvent = tuple[float, float, tuple[int, ...], int]
+
+
+@lru_cache(maxsize=32)
+def _note_events(path_str: str, mtime_ns: int) -> tuple[_NoteEvent, ...]:
+    """Timed notes of a MIDI file for synthesis, memoized per (path, mtime)
+
+    Times come from the flattened stream's secondsMap, which follows every tempo
+    mark, not just the first.
+    """
+    midi_stream = _parse_midi_stream(path_str, mtime_ns)
+    if midi_stream is None:
+        return ()
+
+    events: list[_NoteEvent] = []
+    for entry in midi_stream.flatten().secondsMap:
+        element = entry["element"]
+        # Tempo marks, time signatures and rests carry no pitches
+        pitches = tuple(pitch.midi for pitch in getattr(element, "pitches", ()))
+        if not pitches:
+            continue
+        velocity = 60
+        if hasattr(element, "volume") and element.volume.velocity is not None:
+            velocity = int(element.volume.velocity)
+        events.append((entry["offsetSeconds"], entry["durationSeconds"], pitches, velocity))
+    return tuple(events)
+
+
+def _load_note_events(midi_path: Path) -> tuple[_NoteEvent, ...]:
+    """Load the timed notes of a MIDI file, reusing a cached parse when unchanged"""
+    return _note_events(str(midi_path), midi_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _render_sheet_svg(path_str: str, mtime_ns: int) -> str:
+    """Render a MIDI file to sheet music SVG, memoized per (path, mtime)
+
+    MusicXML export and verovio layout are the slow part of notation rendering,
+    and the same file is often rendered again for another format request.
+    """
+    import verovio
+    from music21.musicxml.m21ToXml import GeneralObjectExporter
+
+    score = _parse_midi_stream(path_str, mtime_ns)
+    if score is None:
+        raise ValueError("Failed to parse MIDI file")
+
+    # Export to MusicXML in memory (music21's native format — no external tools needed).
+    # The exporter runs makeNotation on a copy, so the cached stream is left untouched.
+    xml_str = GeneralObjectExporter(score).parse().decode("utf-8")
+
+    # Render MusicXML → SVG with verovio
+    tk = verovio.toolkit()
+    tk.setOptions({"adjustPageWidth": True, "adjustPageHeight": True, "scale": 40})
+    tk.loadData(xml_str)
+    return str(tk.renderToSVG(1))
+
+
 class MidiTools(ToolCollection):
     """MIDI processing MCP tools"""
 
+    SAMPLE_RATE = 44100
+
     def __init__(self):
         self.storage_path = Path(settings.midi_storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self._soundfont_cache: Path | None = None
+        self._fluidsynth_cmd: str | None = None
+        self._fluidsynth_resolved = False
 
     def get_tools(self) -> list[Tool]:
         """Get Tool instances"""
@@ -282,25 +362,38 @@ Error Handling:
         self, midi_path: Path, soundfont_path: Path, instrument: str
     ) -> dict[str, Any]:
         """Synthesize using fluidsynth CLI (preferred method)"""
-        import shutil
         import subprocess
-        import tempfile
 
         import soundfile as sf
 
-        fluidsynth_cmd = shutil.which("fluidsynth")
+        fluidsynth_cmd = self._find_fluidsynth_cli()
         if not fluidsynth_cmd:
             raise FileNotFoundError("fluidsynth CLI not found")
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_wav:
-            tmp_wav_path = tmp_wav.name
+        audio_file_id = str(uuid.uuid4())
+        from zikos.config import settings
+
+        audio_storage = Path(settings.audio_storage_path)
+        audio_storage.mkdir(parents=True, exist_ok=True)
+        audio_path = audio_storage / f"{audio_file_id}.wav"
 
+        # Render straight into storage: FluidSynth already writes a WAV, so a
+        # temp file plus a decode/re-encode round-trip would only copy the samples.
+        # Format and rate are explicit (the rate matches preprocessed uploads) and
+        # -q keeps the banner out of the captured output. The render runs in a
+        # worker thread so concurrent syntheses don't block the event loop.
         try:
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 [
                     fluidsynth_cmd,
+                    "-q",
                     "-F",
-                    str(tmp_wav_path),
+                    str(audio_path),
+                    "-T",
+                    "wav",
+                    "-r",
+                    str(self.SAMPLE_RATE),
                     "-n",
                     "-i",
                     str(soundfont_path),
@@ -314,33 +407,21 @@ Error Handling:
             if result.returncode != 0:
                 raise RuntimeError(f"FluidSynth synthesis failed: {result.stderr}")
 
-            if not Path(tmp_wav_path).exists():
+            if not audio_path.exists():
                 raise RuntimeError("FluidSynth did not generate output file")
 
-            audio_data, sample_rate = sf.read(tmp_wav_path)
-
-            audio_file_id = str(uuid.uuid4())
-            from zikos.config import settings
-
-            audio_storage = Path(settings.audio_storage_path)
-            audio_storage.mkdir(parents=True, exist_ok=True)
-            audio_path = audio_storage / f"{audio_file_id}.wav"
-
-            sf.write(str(audio_path), audio_data, sample_rate)
-
-            duration = len(audio_data) / sample_rate
-
-            return {
-                "audio_file_id": audio_file_id,
-                "midi_file_id": midi_path.stem,
-                "instrument": instrument,
-                "duration": duration,
-                "synthesis_method": "fluidsynth",
-            }
-
-        finally:
-            if Path(tmp_wav_path).exists():
-                Path(tmp_wav_path).unlink()
+            duration = sf.info(str(audio_path)).duration
+        except BaseException:
+            audio_path.unlink(missing_ok=True)
+            raise
+
+        return {
+            "audio_file_id": audio_file_id,
+            "midi_file_id": midi_path.stem,
+            "instrument": instrument,
+            "duration": duration,
+            "synthesis_method": "fluidsynth",
+        }
 
     async def _synthesize_with_pyfluidsynth(
         self, midi_path: Path, soundfont_path: Path, instrument: str
@@ -353,11 +434,7 @@ Error Handling:
         except ImportError as e:
             raise ImportError(f"pyfluidsynth not available: {e}") from e
 
-        from music21 import midi
-
-        midi_stream = midi.translate.midiFilePathToStream(str(midi_path))
-        if midi_stream is None:
-            raise ValueError("Failed to parse MIDI file")
+        notes = _load_note_events(midi_path)
 
         fs = fluidsynth.Synth()
         fs.start()
@@ -369,29 +446,46 @@ Error Handling:
 
             fs.program_select(0, sfid, 0, self._instrument_to_program(instrument))
 
-            sample_rate = 44100
-            audio_chunks = []
-
-            for element in midi_stream.flat.notes:
-                if hasattr(element, "pitch"):
-                    pitch_midi = element.pitch.midi
-                    duration = float(element.duration.quarterLength)
-                    velocity = 60
+            sample_rate = self.SAMPLE_RATE
+
+            # Schedule note on/off events by sample position so overlapping notes
+            # and chords sound together, then render the gaps between events
+            # straight into one preallocated stereo buffer.
+            events: list[tuple[int, int, int, int]] = []
+            for offset_seconds, duration_seconds, pitches, velocity in notes:
+                start = int(round(offset_seconds * sample_rate))
+                length = int(round(duration_seconds * sample_rate))
+                # A zero-length note's off would sort before its on and leave it stuck
+                if length <= 0:
+                    continue
+                for pitch_midi in pitches:
+                    events.append((start, 1, pitch_midi, velocity))
+                    events.append((start + length, 0, pitch_midi, 0))
+
+            if not events:
+                raise ValueError("No audio data generated from MIDI")
 
-                    if hasattr(element, "volume") and hasattr(element.volume, "velocity"):
-                        velocity = element.volume.velocity
+            # Note-offs sort before note-ons at the same sample so repeated pitches retrigger
+            events.sort()
+            total_samples = events[-1][0]
+            if total_samples <= 0:
+                raise ValueError("No audio data generated from MIDI")
 
+            pcm = np.empty((total_samples, 2), dtype=np.int16)
+            cursor = 0
+            for sample_pos, is_note_on, pitch_midi, velocity in events:
+                if sample_pos > cursor:
+                    pcm[cursor:sample_pos] = np.asarray(
+                        fs.get_samples(sample_pos - cursor), dtype=np.int16
+                    ).reshape(-1, 2)
+                    cursor = sample_pos
+                if is_note_on:
                     fs.noteon(0, pitch_midi, velocity)
-                    samples = int(duration * sample_rate)
-                    audio_chunk = fs.get_samples(samples)
-                    audio_chunks.append(audio_chunk)
+                else:
                     fs.noteoff(0, pitch_midi)
 
-            if not audio_chunks:
-                raise ValueError("No audio data generated from MIDI")
-
-            audio_array = np.concatenate(audio_chunks)
-            audio_array = audio_array.astype(np.float32) / 32768.0
+            # Single fused pass: int16 -> scaled float32 without an intermediate copy
+            audio_array = np.multiply(pcm, np.float32(1.0 / 32768.0), dtype=np.float32)
 
             audio_file_id = str(uuid.uuid4())
             from zikos.config import settings
@@ -427,35 +521,17 @@ Error Handling:
             )
 
         try:
-            import tempfile
-
-            import verovio
-            from music21 import midi
-
-            score = midi.translate.midiFilePathToStream(str(midi_path))
-            if score is None:
-                raise ValueError("Failed to parse MIDI file")
-
-            # Export to MusicXML (music21's native format — no external tools needed)
-            with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as tmp:
-                tmp_path = Path(tmp.name)
-            score.write("musicxml", fp=str(tmp_path))
-            xml_str = tmp_path.read_text(encoding="utf-8")
-            tmp_path.unlink(missing_ok=True)
-
-            # Render MusicXML → SVG with verovio
-            tk = verovio.toolkit()
-            tk.setOptions({"adjustPageWidth": True, "adjustPageHeight": True, "scale": 40})
-            tk.loadData(xml_str)
-
             notation_path = Path(settings.notation_storage_path)
             notation_path.mkdir(parents=True, exist_ok=True)
 
             result: dict[str, Any] = {"midi_file_id": midi_file_id, "format": format}
 
+            # Only sheet music is rendered; "tabs" alone needs no parse, export or layout
             if format in ("sheet_music", "both"):
+                svg = _render_sheet_svg(str(midi_path), midi_path.stat().st_mtime_ns)
+
                 sheet_path = notation_path / f"sheet_{midi_file_id}.svg"
-                sheet_path.write_text(tk.renderToSVG(1), encoding="utf-8")
+                sheet_path.write_text(svg, encoding="utf-8")
                 result["sheet_music_url"] = f"/notation/sheet_{midi_file_id}.svg"
 
             if format in ("tabs", "both"):
@@ -483,9 +559,26 @@ Error Handling:
         3. ~/.fluidsynth/default_sound_font.sf2 — midi2audio convention, cross-platform
         4. Ask FluidSynth itself for its compile-time synth.default-soundfont setting;
            if the reported path doesn't exist, scan sibling .sf2 files in that directory
+
+        A found SoundFont is cached on the instance so later calls skip the scan;
+        a miss is not cached, so installing one takes effect without a restart.
         """
-        import os
+        if self._soundfont_cache is None:
+            self._soundfont_cache = self._scan_for_soundfont()
+        return self._soundfont_cache
+
+    def _find_fluidsynth_cli(self) -> str | None:
+        """Locate the fluidsynth executable once per instance (PATH scan)"""
         import shutil
+
+        if not self._fluidsynth_resolved:
+            self._fluidsynth_cmd = shutil.which("fluidsynth")
+            self._fluidsynth_resolved = True
+        return self._fluidsynth_cmd
+
+    def _scan_for_soundfont(self) -> Path | None:
+        """Walk the SoundFont resolution order described in _find_soundfont"""
+        import os
         import subprocess
 
         from zikos.config import settings
@@ -513,7 +606,7 @@ Error Handling:
         #    different filename than what FluidSynth reports (e.g. Arch reports
         #    default.sf2 but only FluidR3_GM.sf2 exists). If the exact file is
         #    missing, scan siblings in the same directory.
-        fluidsynth_cmd = shutil.which("fluidsynth")
+        fluidsynth_cmd = self._find_fluidsynth_cli()
         if fluidsynth_cmd:
             try:
                 proc = subprocess.run(
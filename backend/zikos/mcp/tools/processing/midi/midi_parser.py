@@ -1,6 +1,7 @@
 """MIDI parser for simplified format"""
 
 import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -26,11 +27,33 @@ _FORMAT_HINT = (
     "Notes: use names like C4, D#5, Bb3. Duration is in quarter notes (1.0=quarter, 2.0=half, 0.5=eighth)."
 )
 
+_MIDI_BLOCK_RE = re.compile(r"\[MIDI\](.*?)\[/MIDI\]", re.DOTALL)
+_TRACK_RE = re.compile(r"track\s+(\d+)(?:\s*\(([^)]+)\))?:", re.IGNORECASE)
+# Matches whitespace-delimited "velocity=V" / "duration=D" tokens in any order
+_NOTE_ATTR_RE = re.compile(r"(?:^|\s)(velocity|duration)=(\S*)")
+
+
+def _parse_tempo(value: str) -> int:
+    try:
+        return int(float(value))
+    except ValueError as err:
+        raise MidiParseError(f"Invalid tempo: {value}") from err
+
+
+# Lowercased header name -> (metadata field, value converter)
+_METADATA_FIELDS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "tempo": ("tempo", _parse_tempo),
+    "time signature": ("time_signature", str),
+    "time sig": ("time_signature", str),
+    "key": ("key", str),
+}
+# One anchored match per line instead of a startswith test per header
+_METADATA_RE = re.compile(r"(tempo|time signature|time sig|key):(.*)", re.IGNORECASE)
+
 
 def parse_midi_text(midi_text: str) -> dict[str, Any]:
     """Parse simplified MIDI format to structured data"""
-    midi_block_pattern = r"\[MIDI\](.*?)\[/MIDI\]"
-    match = re.search(midi_block_pattern, midi_text, re.DOTALL)
+    match = _MIDI_BLOCK_RE.search(midi_text)
 
     if not match:
         raise MidiParseError(f"No [MIDI]...[/MIDI] block found. {_FORMAT_HINT}")
@@ -47,27 +70,14 @@ def parse_midi_text(midi_text: str) -> dict[str, Any]:
     current_track: dict[str, Any] | None = None
 
     for line in lines:
-        line_lower = line.lower()
-
-        if line_lower.startswith("tempo:"):
-            tempo_str = line.split(":", 1)[1].strip()
-            try:
-                metadata["tempo"] = int(float(tempo_str))
-            except ValueError as err:
-                raise MidiParseError(f"Invalid tempo: {tempo_str}") from err
-
-        elif line_lower.startswith("time signature:") or line_lower.startswith("time sig:"):
-            ts_str = line.split(":", 1)[1].strip()
-            metadata["time_signature"] = ts_str
-
-        elif line_lower.startswith("key:"):
-            key_str = line.split(":", 1)[1].strip()
-            metadata["key"] = key_str
-
-        elif line_lower.startswith("track"):
+        metadata_match = _METADATA_RE.match(line)
+        if metadata_match:
+            field, convert = _METADATA_FIELDS[metadata_match.group(1).lower()]
+            metadata[field] = convert(metadata_match.group(2).strip())
+        elif line.lower().startswith("track"):
             if current_track:
                 tracks.append(current_track)
-            track_match = re.match(r"track\s+(\d+)(?:\s*\(([^)]+)\))?:", line, re.IGNORECASE)
+            track_match = _TRACK_RE.match(line)
             track_num = int(track_match.group(1)) if track_match else 1
             track_name = (
                 track_match.group(2).strip() if track_match and track_match.group(2) else None
@@ -99,11 +109,7 @@ def parse_midi_text(midi_text: str) -> dict[str, Any]:
 
 def parse_note_line(line: str) -> dict[str, Any] | None:
     """Parse a note line like 'C4 velocity=60 duration=0.5'"""
-    line = line.strip()
-    if not line:
-        return None
-
-    parts = line.split()
+    parts = line.split(None, 1)
     if not parts:
         return None
 
@@ -111,16 +117,14 @@ def parse_note_line(line: str) -> dict[str, Any] | None:
     velocity = 60
     duration = 0.5
 
-    for part in parts[1:]:
-        if part.startswith("velocity="):
-            try:
-                velocity = int(float(part.split("=", 1)[1]))
-            except (ValueError, IndexError):
-                pass
-        elif part.startswith("duration="):
+    if len(parts) > 1:
+        for attr, value in _NOTE_ATTR_RE.findall(parts[1]):
             try:
-                duration = float(part.split("=", 1)[1])
-            except (ValueError, IndexError):
+                if attr == "velocity":
+                    velocity = int(float(value))
+                else:
+                    duration = float(value)
+            except ValueError:
                 pass
 
     return {
@@ -1,6 +1,9 @@
 """Audio service"""
 
+import asyncio
+import copy
 import uuid
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -8,17 +11,22 @@ from fastapi import UploadFile
 
 from zikos.config import settings
 from zikos.mcp.tools.analysis import AudioAnalysisTools
+from zikos.mcp.tools.audio import instrument_detector, pitch, rhythm, tempo
+from zikos.mcp.tools.audio.utils import load_audio, resolve_audio_path
 from zikos.services.audio_preprocessing import AudioPreprocessingService
 
 
 class AudioService:
     """Service for audio storage and analysis"""
 
+    BASELINE_CACHE_SIZE = 64
+
     def __init__(self):
         self.storage_path = Path(settings.audio_storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.analysis_tools = AudioAnalysisTools()
         self.preprocessing_service = AudioPreprocessingService()
+        self._baseline_cache: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
 
     async def store_audio(self, file: UploadFile, recording_id: str | None = None) -> str:
         """Store uploaded audio file with preprocessing"""
@@ -44,19 +52,67 @@ class AudioService:
         return audio_file_id
 
     async def run_baseline_analysis(self, audio_file_id: str) -> dict[str, Any]:
-        """Run baseline analysis tools"""
-        tempo_result = await self.analysis_tools.analyze_tempo(audio_file_id)
-        pitch_result = await self.analysis_tools.detect_pitch(audio_file_id)
-        rhythm_result = await self.analysis_tools.analyze_rhythm(audio_file_id)
-        instrument_result = await self.analysis_tools.detect_instrument(audio_file_id)
+        """Run baseline analysis tools
+
+        Results are memoized per (audio_file_id, mtime) so repeated requests for the
+        same recording skip re-decoding the WAV. Rewriting the file invalidates the entry.
+        Results with a failed analysis are not cached, and callers get their own copy.
+        """
+        cache_key = self._baseline_cache_key(audio_file_id)
+        if cache_key is not None and cache_key in self._baseline_cache:
+            self._baseline_cache.move_to_end(cache_key)
+            return copy.deepcopy(self._baseline_cache[cache_key])
+
+        # Decode the recording once and hand the same array to every analyzer. If it
+        # cannot be resolved or decoded, the per-tool path reports the error per analysis.
+        try:
+            y, sr = await asyncio.to_thread(load_audio, resolve_audio_path(audio_file_id))
+        except Exception:
+            tempo_result, pitch_result, rhythm_result, instrument_result = await asyncio.gather(
+                self.analysis_tools.analyze_tempo(audio_file_id),
+                self.analysis_tools.detect_pitch(audio_file_id),
+                self.analysis_tools.analyze_rhythm(audio_file_id),
+                self.analysis_tools.detect_instrument(audio_file_id),
+            )
+        else:
+            # The analyzers are CPU-bound librosa code; running each on a worker thread
+            # lets their FFT/BLAS sections (which release the GIL) overlap instead of
+            # executing back to back on the event loop.
+            tempo_result, pitch_result, rhythm_result, instrument_result = await asyncio.gather(
+                *(
+                    asyncio.to_thread(analyze, y, sr)
+                    for analyze in (
+                        tempo.analyze_tempo_array,
+                        pitch.detect_pitch_array,
+                        rhythm.analyze_rhythm_array,
+                        instrument_detector.detect_instrument_array,
+                    )
+                )
+            )
 
-        return {
+        result = {
             "tempo": tempo_result,
             "pitch": pitch_result,
             "rhythm": rhythm_result,
             "instrument": instrument_result,
         }
 
+        failed = any("error" in analysis for analysis in result.values())
+        if cache_key is not None and not failed:
+            self._baseline_cache[cache_key] = result
+            if len(self._baseline_cache) > self.BASELINE_CACHE_SIZE:
+                self._baseline_cache.popitem(last=False)
+
+        return copy.deepcopy(result)
+
+    def _baseline_cache_key(self, audio_file_id: str) -> tuple[str, int] | None:
+        """Build the baseline cache key, or None if the file cannot be resolved"""
+        try:
+            mtime_ns = resolve_audio_path(audio_file_id).stat().st_mtime_ns
+        except OSError:
+            return None
+        return (audio_file_id, mtime_ns)
+
     async def get_audio_info(self, audio_file_id: str) -> dict[str, Any]:
         """Get audio file information"""
         result = await self.analysis_tools.get_audio_info(audio_file_id)
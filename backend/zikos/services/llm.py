@@ -10,7 +10,7 @@ from typing import Any
 
 from zikos.config import settings
 from zikos.mcp.server import MCPServer
-from zikos.mcp.tool import ToolCategory
+from zikos.mcp.tool import FRONTEND_TOOL_CATEGORIES, ToolCategory
 from zikos.services.audio import AudioService
 from zikos.services.llm_init import initialize_llm_backend
 from zikos.services.llm_orchestration.conversation_manager import ConversationManager
@@ -58,6 +58,11 @@ class LLMService:
         self.user_settings_service = UserSettingsService(settings.user_settings_path)
         self.audio_service = AudioService()
         self.thinking_extractor = ThinkingExtractor()
+        # SYSTEM_PROMPT.md is read and parsed once here; every new session reuses it
+        self._core_prompt_section = CorePromptSection(
+            Path(__file__).parent.parent.parent.parent / "SYSTEM_PROMPT.md"
+        )
+        self._core_prompt_section.render()
         self.conversation_manager = ConversationManager(self._get_system_prompt)
         self.message_preparer = MessagePreparer()
         self.tool_injector = ToolInjector()
@@ -107,6 +112,10 @@ class LLMService:
         )
         return result
 
+    def purge_session(self, session_id: str) -> None:
+        """Drop a session's conversation history"""
+        self.conversation_manager.purge_session(session_id)
+
     def _extract_thinking(self, content: str | None) -> tuple[str, str]:
         result: tuple[str, str] = self.thinking_extractor.extract(content)
         return result
@@ -146,10 +155,7 @@ class LLMService:
                 tool_name = chunk.get("tool_name")
                 if tool_name:
                     tool = tool_registry.get_tool(tool_name)
-                    if tool and tool.category in (
-                        ToolCategory.DISPLAY_WIDGET,
-                        ToolCategory.INTERACTION_REQUEST,
-                    ):
+                    if tool and tool.category in FRONTEND_TOOL_CATEGORIES:
                         tool_call_response = chunk
 
             if chunk_type in ("response", "error"):
@@ -641,11 +647,14 @@ class LLMService:
                 )
                 return cached_prompt
 
-        if prompt_file_path is None:
-            prompt_file_path = Path(__file__).parent.parent.parent.parent / "SYSTEM_PROMPT.md"
+        core_section = (
+            self._core_prompt_section
+            if prompt_file_path is None
+            else CorePromptSection(prompt_file_path)
+        )
 
         builder = SystemPromptBuilder()
-        builder.add_section(CorePromptSection(prompt_file_path))
+        builder.add_section(core_section)
         builder.add_section(UserProfileSection(self.user_settings_service.load()))
 
         result: str = builder.build()
@@ -1,6 +1,10 @@
 """LlamaCpp backend implementation"""
 
-from collections.abc import AsyncGenerator
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import Any
 
 try:
@@ -11,6 +15,48 @@ except ImportError:
 
 from zikos.services.llm_backends.base import LLMBackend
 
+_STREAM_END = object()
+
+# general.file_type values for unquantized weights (llama_ftype)
+_UNQUANTIZED_FILE_TYPES = {"0": "F32", "1": "F16", "32": "BF16"}
+
+
+@dataclass
+class _SharedLlama:
+    """A loaded model shared by every backend initialized with the same parameters"""
+
+    llm: Any
+    # A Llama instance is not thread-safe; inference runs on worker threads, so only
+    # one generation may drive it at a time, whichever backend or event loop it comes from
+    inference_lock: threading.Lock = field(default_factory=threading.Lock)
+    refs: int = 0
+
+
+# Loaded models keyed on their constructor arguments, so constructing LLMService more
+# than once per process does not mmap the GGUF and allocate a KV cache again
+_LLAMA_CACHE: dict[str, _SharedLlama] = {}
+
+
+@asynccontextmanager
+async def _hold(lock: threading.Lock) -> AsyncIterator[None]:
+    """Hold a threading lock from async code without blocking the event loop
+
+    Cached models outlive the event loop that loaded them, so an asyncio.Lock (bound to
+    the first loop that waits on it) cannot guard them.
+    """
+    if not lock.acquire(blocking=False):
+        waiter = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+        try:
+            await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            # The worker thread still takes the lock; hand it back as soon as it does
+            waiter.add_done_callback(lambda _: lock.release())
+            raise
+    try:
+        yield
+    finally:
+        lock.release()
+
 
 class LlamaCppBackend(LLMBackend):
     """Backend using llama-cpp-python for GGUF models"""
@@ -21,11 +67,14 @@ class LlamaCppBackend(LLMBackend):
         self.model_path: str | None = None
         self.system_prompt_cache_path: str | None = None
         self._cached_system_prompt_text: str | None = None
+        self._shared_key: str | None = None
+        self._inference_lock = threading.Lock()
 
     def initialize(self, **kwargs: Any) -> None:
         """Initialize llama-cpp-python backend.
 
         Expected kwargs: model_path, n_ctx, n_gpu_layers, temperature, top_p, ...
+        kv_cache_type (e.g. "q8_0") quantizes the KV cache when flash_attn is enabled.
         Extra kwargs are forwarded to the Llama constructor.
         """
         if Llama is None:
@@ -36,6 +85,7 @@ class LlamaCppBackend(LLMBackend):
         model_path: str = kwargs.pop("model_path")
         n_ctx: int = kwargs.pop("n_ctx", 32768)
         n_gpu_layers: int = kwargs.pop("n_gpu_layers", 0)
+        kv_cache_type: str = kwargs.pop("kv_cache_type", "")
         kwargs.pop("temperature", None)
         kwargs.pop("top_p", None)
 
@@ -90,9 +140,53 @@ class LlamaCppBackend(LLMBackend):
         from pathlib import Path
 
         logger = logging.getLogger(__name__)
-        logger.info(f"Initializing Llama with: {init_kwargs}")
 
-        self.llm = Llama(**init_kwargs)
+        # A quantized V cache requires flash attention in llama.cpp
+        quantized_kv = False
+        if kv_cache_type and init_kwargs.get("flash_attn"):
+            from llama_cpp import llama_cpp
+
+            ggml_type = getattr(llama_cpp, f"GGML_TYPE_{kv_cache_type.upper()}", None)
+            if ggml_type is None:
+                logger.warning(f"Unknown KV cache type {kv_cache_type!r}, keeping the default")
+            elif "type_k" not in init_kwargs and "type_v" not in init_kwargs:
+                init_kwargs["type_k"] = ggml_type
+                init_kwargs["type_v"] = ggml_type
+                quantized_kv = True
+
+        self.close()
+        shared_key = repr(sorted(init_kwargs.items()))
+        shared = _LLAMA_CACHE.get(shared_key)
+        if shared is None:
+            logger.info(f"Initializing Llama with: {init_kwargs}")
+            try:
+                llm = Llama(**init_kwargs)
+            except ValueError:
+                if not quantized_kv:
+                    raise
+                # Builds without flash attention support cannot create a context with a
+                # quantized V cache; fall back to llama.cpp's default f16 cache
+                logger.warning(
+                    f"Could not create a {kv_cache_type} KV cache "
+                    "(flash attention unavailable?), falling back to f16"
+                )
+                del init_kwargs["type_k"], init_kwargs["type_v"]
+                llm = Llama(**init_kwargs)
+            shared = _LLAMA_CACHE[shared_key] = _SharedLlama(llm)
+        else:
+            logger.info(f"Reusing loaded Llama for {Path(model_path).name}")
+        shared.refs += 1
+        self._shared_key = shared_key
+        self._inference_lock = shared.inference_lock
+        self.llm = shared.llm
+
+        file_type = str(getattr(self.llm, "metadata", {}).get("general.file_type", ""))
+        if file_type in _UNQUANTIZED_FILE_TYPES:
+            logger.warning(
+                f"{Path(model_path).name} has {_UNQUANTIZED_FILE_TYPES[file_type]} weights. "
+                "Decoding is memory-bound; a Q4_K_M or Q5_K_M GGUF is roughly half the VRAM "
+                "and about twice as fast with negligible quality loss."
+            )
 
         try:
             if hasattr(self.llm, "n_ctx"):
@@ -212,13 +306,37 @@ class LlamaCppBackend(LLMBackend):
             if "request_audio_recording" in system_content:
                 logger.info("System prompt contains 'request_audio_recording' reference")
 
-        stream = self.llm.create_chat_completion(**completion_kwargs)
-
-        for chunk in stream:
-            chunk_dict = dict(chunk)  # type: ignore[arg-type]
-            logger.debug(f"Received chunk: {chunk_dict}")
-
-            yield chunk_dict
+        # Prompt evaluation and each decode step run on a worker thread so the event loop
+        # keeps serving other sessions between tokens. If the consumer stops iterating
+        # (client disconnect, cancellation), no further tokens are requested.
+        async with _hold(self._inference_lock):
+            stream = None
+            pending: asyncio.Task[Any] | None = None
+            try:
+                pending = asyncio.create_task(
+                    asyncio.to_thread(self.llm.create_chat_completion, **completion_kwargs)
+                )
+                # Shielded so a cancellation leaves the worker call running and tracked
+                stream = iter(await asyncio.shield(pending))
+                while True:
+                    pending = asyncio.create_task(asyncio.to_thread(next, stream, _STREAM_END))
+                    chunk = await asyncio.shield(pending)
+                    if chunk is _STREAM_END:
+                        break
+                    chunk_dict = dict(chunk)  # type: ignore[call-overload]
+                    logger.debug(f"Received chunk: {chunk_dict}")
+
+                    yield chunk_dict
+            finally:
+                if pending is not None and not pending.done():
+                    # Cancelled mid-step: the worker thread is still driving the shared
+                    # model, so the lock is held until that step returns
+                    await asyncio.wait({pending})
+                if pending is not None and not pending.cancelled():
+                    pending.exception()  # Retrieved so an abandoned failure is not logged
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
 
     def supports_tools(self) -> bool:
         """LlamaCpp supports tools via create_chat_completion"""
@@ -237,14 +355,26 @@ class LlamaCppBackend(LLMBackend):
         return self.n_ctx
 
     def close(self) -> None:
-        """Cleanup llama-cpp-python resources"""
-        if self.llm is not None:
-            try:
-                if hasattr(self.llm, "close"):
-                    self.llm.close()
-            except Exception:
-                pass
-            self.llm = None
+        """Release this backend's reference, freeing the model once no backend uses it"""
+        if self.llm is None:
+            return
+
+        if self._shared_key is not None:
+            shared = _LLAMA_CACHE[self._shared_key]
+            shared.refs -= 1
+            if shared.refs == 0:
+                del _LLAMA_CACHE[self._shared_key]
+            self._shared_key = None
+            if shared.refs > 0:
+                self.llm = None
+                return
+
+        try:
+            if hasattr(self.llm, "close"):
+                self.llm.close()
+        except Exception:
+            pass
+        self.llm = None
 
     def _load_system_prompt_cache(self) -> None:
         """Load pre-computed system prompt KV cache if available"""
@@ -1,12 +1,13 @@
 """LLM backend initialization with automatic context sizing and OOM retry"""
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from zikos.config import settings
-from zikos.services.llm_backends import _CLOUD_PROVIDERS, create_backend
+from zikos.services.llm_backends import _CLOUD_PROVIDERS, LlamaCppBackend, create_backend
 from zikos.services.llm_orchestration.tool_call_parser import ToolCallParser, get_tool_call_parser
 from zikos.services.model_strategy import ModelStrategy, get_model_strategy
 from zikos.utils.context_length import detect_context_length, get_recommended_context_length
@@ -73,6 +74,11 @@ def initialize_llm_backend() -> LLMInitResult:
         _logger.info(f"Initializing LLM backend: {type(backend).__name__}")
         _logger.info(f"Model path: {model_path_str}")
         _logger.info(f"GPU layers: {n_gpu_layers}")
+        if n_gpu_layers == 0 and isinstance(backend, LlamaCppBackend):
+            _logger.warning(
+                "n_gpu_layers is 0: the whole model runs on CPU, which is several times slower. "
+                "Set LLM_N_GPU_LAYERS=-1 to offload all layers when a GPU is available."
+            )
 
         backend = _initialize_with_oom_retry(
             backend, model_path_str, backend_type, n_ctx, n_gpu_layers
@@ -125,6 +131,28 @@ def _determine_gpu_layers(model_path_str: str, backend_type: str | None) -> int:
     return n_gpu_layers
 
 
+def _backend_tuning_kwargs(backend) -> dict[str, Any]:
+    """Backend-specific performance options forwarded to initialize()"""
+    if not isinstance(backend, LlamaCppBackend):
+        return {}
+
+    n_threads = settings.llm_n_threads
+    if n_threads is None:
+        import psutil
+
+        n_threads = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+    return {
+        "n_batch": settings.llm_n_batch,
+        "n_ubatch": min(settings.llm_n_ubatch, settings.llm_n_batch),
+        "n_threads": n_threads,
+        "use_mlock": settings.llm_use_mlock,
+        "flash_attn": settings.llm_flash_attn,
+        "offload_kqv": True,
+        "kv_cache_type": settings.llm_kv_cache_type,
+    }
+
+
 def _initialize_with_oom_retry(
     backend, model_path_str: str, backend_type: str | None, n_ctx: int, n_gpu_layers: int
 ):
@@ -142,6 +170,7 @@ def _initialize_with_oom_retry(
                 n_gpu_layers=n_gpu_layers,
                 temperature=settings.llm_temperature,
                 top_p=settings.llm_top_p,
+                **_backend_tuning_kwargs(backend),
             )
             return backend
         except (MemoryError, RuntimeError, OSError) as e:
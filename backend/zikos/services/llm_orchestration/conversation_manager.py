@@ -1,7 +1,10 @@
 """Manage conversation history for LLM sessions"""
 
+import time
 from typing import Any
 
+from zikos.constants import LLM
+
 
 class ConversationManager:
     """Manages conversation history for different sessions"""
@@ -11,21 +14,78 @@ class ConversationManager:
         self._get_system_prompt = system_prompt_getter
         # Pending interaction requests: session_id → {tool_call_id, tool_name}
         self._pending_interactions: dict[str, dict[str, str]] = {}
+        # Last access time per session (time.monotonic), used for TTL eviction
+        self._last_access: dict[str, float] = {}
 
     def get_history(self, session_id: str) -> list[dict[str, Any]]:
         """Get conversation history for session
 
+        Sessions idle for longer than LLM.CONVERSATION_TTL_SECONDS are evicted, and
+        existing histories are trimmed to the stored bounds before being returned.
+
         Args:
             session_id: Session identifier
 
         Returns:
             List of message dictionaries
         """
+        now = time.monotonic()
+        self._evict_expired(now)
+        self._last_access[session_id] = now
+
         if session_id not in self.conversations:
             system_prompt = self._get_system_prompt()
             self.conversations[session_id] = [{"role": "system", "content": system_prompt}]
+        else:
+            self.trim_history(self.conversations[session_id])
         return self.conversations[session_id]
 
+    def trim_history(self, history: list[dict[str, Any]]) -> None:
+        """Drop the oldest turns in place until the history fits the stored bounds
+
+        The leading system message is always kept, and cuts land on a user message so
+        an assistant tool call is never separated from its tool results. The most
+        recent user turn is kept even if it alone exceeds the bounds.
+        """
+        start = 1 if history and history[0].get("role") == "system" else 0
+        total_chars = sum(len(str(msg.get("content") or "")) for msg in history)
+        n = len(history)
+
+        cut = start
+        while cut < n and (
+            n - cut + start > LLM.MAX_HISTORY_MESSAGES or total_chars > LLM.MAX_HISTORY_CHARS
+        ):
+            total_chars -= len(str(history[cut].get("content") or ""))
+            cut += 1
+        if cut == start:
+            return
+
+        while cut < n and history[cut].get("role") != "user":
+            cut += 1
+        if cut == n:
+            last_user = next(
+                (i for i in range(n - 1, start - 1, -1) if history[i].get("role") == "user"),
+                start,
+            )
+            cut = last_user
+
+        del history[start:cut]
+
+    def purge_session(self, session_id: str) -> None:
+        """Forget a session's history and any pending interaction"""
+        self.conversations.pop(session_id, None)
+        self._pending_interactions.pop(session_id, None)
+        self._last_access.pop(session_id, None)
+
+    def _evict_expired(self, now: float) -> None:
+        expired = [
+            session_id
+            for session_id, last_access in self._last_access.items()
+            if now - last_access > LLM.CONVERSATION_TTL_SECONDS
+        ]
+        for session_id in expired:
+            self.purge_session(session_id)
+
     def set_pending_interaction(self, session_id: str, tool_call_id: str, tool_name: str) -> None:
         self._pending_interactions[session_id] = {
             "tool_call_id": tool_call_id,
@@ -6,13 +6,13 @@ from typing import Any
 
 from zikos.constants import LLM
 from zikos.mcp.server import MCPServer
-from zikos.mcp.tool import ToolCategory
+from zikos.mcp.tool import FRONTEND_TOOL_CATEGORIES
 from zikos.services.llm_orchestration.conversation_manager import ConversationManager
 from zikos.services.llm_orchestration.message_preparer import MessagePreparer
 from zikos.services.llm_orchestration.response_validator import ResponseValidator
 from zikos.services.llm_orchestration.thinking_extractor import ThinkingExtractor
 from zikos.services.llm_orchestration.tool_call_parser import ToolCallParser
-from zikos.services.llm_orchestration.tool_executor import ToolExecutor
+from zikos.services.llm_orchestration.tool_executor import ToolExecutor, parse_tool_arguments
 from zikos.services.llm_orchestration.tool_injector import ToolInjector
 from zikos.services.model_strategy import ModelStrategy, get_model_strategy
 
@@ -184,10 +184,7 @@ class LLMOrchestrator:
             # Build UI info, filtering out widget/recording tools
             if tool_name:
                 tool = tool_registry.get_tool(tool_name)
-                if tool and tool.category in (
-                    ToolCategory.DISPLAY_WIDGET,
-                    ToolCategory.INTERACTION_REQUEST,
-                ):
+                if tool and tool.category in FRONTEND_TOOL_CATEGORIES:
                     continue
 
             tool_args_str = (
@@ -196,9 +193,7 @@ class LLMOrchestrator:
                 else "{}"
             )
             try:
-                tool_args = (
-                    json.loads(tool_args_str) if isinstance(tool_args_str, str) else tool_args_str
-                )
+                tool_args = parse_tool_arguments(tool_args_str)
             except json.JSONDecodeError:
                 tool_args = {}
 
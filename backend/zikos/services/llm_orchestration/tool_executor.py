@@ -4,15 +4,59 @@ import json
 import logging
 from typing import Any
 
+import orjson
+
 from zikos.config import settings
 from zikos.mcp.server import MCPServer
-from zikos.mcp.tool import ToolCategory
+from zikos.mcp.tool import FRONTEND_TOOL_CATEGORIES
 from zikos.mcp.tool_registry import ToolRegistry
 
 _logger = logging.getLogger("zikos.services.llm_orchestration.tool_executor")
 _conversation_logger = logging.getLogger("zikos.conversation")
 
 
+def parse_tool_arguments(tool_args: Any) -> Any:
+    """Decode a tool call's arguments, passing already-decoded values through
+
+    orjson's JSONDecodeError subclasses json.JSONDecodeError, so callers catch the
+    standard exception.
+    """
+    return orjson.loads(tool_args) if isinstance(tool_args, str) else tool_args
+
+
+def _with_json_keys(value: Any) -> Any:
+    """Copy nested dicts with keys the json module rejects (tuples, paths...) as strings"""
+    if isinstance(value, dict):
+        converted = {}
+        for key, item in value.items():
+            if key is not None and not isinstance(key, str | int | float):
+                key = str(key)
+            converted[key] = _with_json_keys(item)
+        return converted
+    if isinstance(value, list | tuple):
+        return [_with_json_keys(item) for item in value]
+    return value
+
+
+def serialize_tool_result(result: Any) -> str:
+    """Render a tool result as compact JSON for the model
+
+    str(result) would give Python reprs (single quotes, True/None) that cost more tokens
+    and are not valid JSON. Strings pass through unchanged. Values orjson rejects (ints
+    beyond 64 bits, tuple keys) go through the json module instead.
+    """
+    if isinstance(result, str):
+        return result
+    try:
+        return orjson.dumps(
+            result,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+    except (TypeError, ValueError):
+        return json.dumps(_with_json_keys(result), default=str, separators=(",", ":"))
+
+
 class ToolExecutor:
     """Executes tools and handles errors, including widget detection"""
 
@@ -46,9 +90,7 @@ class ToolExecutor:
         tool_args_str = tool_call["function"].get("arguments", "{}")
 
         try:
-            tool_args = (
-                json.loads(tool_args_str) if isinstance(tool_args_str, str) else tool_args_str
-            )
+            tool_args = parse_tool_arguments(tool_args_str)
         except json.JSONDecodeError as e:
             _logger.warning(f"Failed to parse tool arguments: {e}")
             tool_args = {}
@@ -59,10 +101,7 @@ class ToolExecutor:
             _logger.debug(f"  Arguments: {json.dumps(tool_args, indent=2)}")
 
         tool = tool_registry.get_tool(tool_name)
-        is_widget = tool and tool.category in (
-            ToolCategory.DISPLAY_WIDGET,
-            ToolCategory.INTERACTION_REQUEST,
-        )
+        is_widget = tool and tool.category in FRONTEND_TOOL_CATEGORIES
 
         if is_widget:
             if settings.debug_tool_calls:
@@ -125,15 +164,15 @@ class ToolExecutor:
                 "tool_call_id": tool_call_id,
             }
 
+        tool_args = self._parse_tool_args(tool_call)
         _conversation_logger.info(
             f"Session: {session_id}\n"
             f"Tool Call: {tool_name}\n"
-            f"Arguments: {json.dumps(self._parse_tool_args(tool_call), indent=2, default=str)}\n"
+            f"Arguments: {json.dumps(tool_args, indent=2, default=str)}\n"
             f"{'='*80}"
         )
 
         try:
-            tool_args = self._parse_tool_args(tool_call)
             result = await mcp_server.call_tool(tool_name, **tool_args)
 
             if settings.debug_tool_calls:
@@ -150,7 +189,7 @@ class ToolExecutor:
             return {
                 "role": "tool",
                 "name": tool_name,
-                "content": str(result),
+                "content": serialize_tool_result(result),
                 "tool_call_id": tool_call_id,
             }
         except FileNotFoundError as e:
@@ -186,7 +225,7 @@ class ToolExecutor:
 
         tool_args_str = tool_call["function"].get("arguments", "{}")
         try:
-            result = json.loads(tool_args_str) if isinstance(tool_args_str, str) else tool_args_str
+            result = parse_tool_arguments(tool_args_str)
             return result if isinstance(result, dict) else {}
         except json.JSONDecodeError:
             return {}
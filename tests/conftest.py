@@ -1,5 +1,7 @@
 """Pytest configuration and fixtures"""
 
+import asyncio
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -8,13 +10,55 @@ from unittest.mock import patch
 import pytest
 
 
-@pytest.fixture(scope="session", autouse=True)
-def cleanup_logs():
-    """Clean up logs directory after test session"""
-    yield
+def pytest_sessionfinish(session, exitstatus):
+    """Clean up logs directory after test session
+
+    Under pytest-xdist every worker runs its own session, so only the controller
+    removes the directory, once all workers are done writing to it.
+    """
+    if hasattr(session.config, "workerinput"):
+        return
     logs_dir = Path("logs")
     if logs_dir.exists():
-        shutil.rmtree(logs_dir)
+        shutil.rmtree(logs_dir, ignore_errors=True)
+
+
+def _llm_model_configured() -> bool:
+    """Mirror the checks initialize_llm_backend makes before loading a model"""
+    from zikos.config import settings
+
+    if settings.llm_provider:
+        return True
+    model_path = settings.llm_model_path
+    return bool(model_path) and (Path(model_path).exists() or "/" in model_path)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the real-LLM tests up front when no model is configured
+
+    Unit modules define their own fake llm_service fixture, so only comprehensive
+    tests are matched.
+    """
+    if _llm_model_configured():
+        return
+    skip = pytest.mark.skip(reason="LLM not initialized (no model file configured)")
+    for item in items:
+        if "comprehensive" in item.keywords and "llm_service" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is available
+
+    The server runs on uvloop too: uvicorn's default loop="auto" picks it when
+    uvicorn[standard] is installed. Elsewhere the default policy is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture
@@ -70,6 +114,78 @@ def storage_paths(temp_dir, monkeypatch):
         yield temp_dir
 
 
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client for the whole session
+
+    The client is not entered as a context manager, so the app lifespan (LLM
+    initialization) does not run, same as the former per-test clients.
+    """
+    from fastapi.testclient import TestClient
+
+    from zikos.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+async def aclient():
+    """Create an async test client for tests that await endpoints directly
+
+    Like client, it does not run the app lifespan.
+    """
+    from httpx import ASGITransport, AsyncClient
+
+    from zikos.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def llm_service():
+    """One LLMService shared by the real-LLM tests, so the model is loaded once
+
+    Skips when no model is configured. Tests clear the conversations they use.
+    Unless LLM_N_BATCH is set, the prompt batch is raised to 2048 for faster prefill.
+    The override only applies while the backend is initialized; the settings are
+    restored afterwards. The real-LLM tests share the "llm" xdist group, so one
+    worker loads the model and keeps the default thread count.
+    """
+    from zikos.services import llm_init
+    from zikos.services.llm import LLMService
+
+    overrides: dict[str, int] = {}
+    if "LLM_N_BATCH" not in os.environ:
+        overrides["llm_n_batch"] = 2048
+
+    # llm_init's own reference, which stays valid if a test reloads zikos.config
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in overrides.items():
+            mp.setattr(llm_init.settings, name, value)
+        service = LLMService()
+
+    if service.llm is None:
+        pytest.skip("LLM not initialized (no model file configured)")
+    return service
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """One MCPServer shared by the real-LLM tests"""
+    from zikos.mcp.server import MCPServer
+
+    return MCPServer()
+
+
+@pytest.fixture(scope="session")
+def sine_wav_bytes():
+    """0.1 s, 440 Hz 16-bit mono WAV file contents, synthesized once per session"""
+    from tests.helpers.audio_synthesis import make_sine_wav_bytes
+
+    return make_sine_wav_bytes()
+
+
 @pytest.fixture
 def sample_audio_path(temp_dir):
     """Create sample audio file path"""
@@ -1,91 +1,122 @@
 """Audio synthesis helpers for realistic test audio generation
 
-Uses librosa and numpy to create instrument-like sounds, not just sine waves.
+Uses numpy to create instrument-like sounds, not just sine waves. librosa is not
+imported here: it pulls in numba, scipy.signal and friends at collection time.
 """
 
+import functools
+import io
 import math
+import re
+import wave
 from pathlib import Path
 
-import librosa
 import numpy as np
 import soundfile as sf
 
+_NOTE_RE = re.compile(r"^([A-Ga-g])([#b♯♭]*)(-?\d+)$")
+_PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+# Piano: fundamental, octave, fifth, double octave, third, with decreasing amplitude
+_PIANO_HARMONIC_FREQS = np.array([1.0, 2.0, 3.0, 4.0, 5.0], dtype=np.float32)
+_PIANO_AMPLITUDES = np.array([1.0, 0.5, 0.25, 0.125, 0.0625], dtype=np.float32)
+
+# Piano ADSR envelope (Attack, Decay, Sustain, Release)
+_PIANO_ATTACK_TIME = 0.01
+_PIANO_DECAY_TIME = 0.1
+_PIANO_SUSTAIN_LEVEL = 0.7
+_PIANO_RELEASE_TIME = 0.2
+
+
+@functools.lru_cache(maxsize=64)
+def _time_axis(duration: float, n_samples: int) -> np.ndarray:
+    """Sample times for a tone, shared between calls and therefore read-only
+
+    Tests synthesize many tones from a handful of durations, so the linspace is
+    computed once per (duration, n_samples) pair.
+    """
+    t = np.linspace(0, duration, n_samples, dtype=np.float32)
+    t.setflags(write=False)
+    return t
+
 
 def generate_piano_tone(
     frequency: float, duration: float, sample_rate: int = 44100, velocity: float = 0.7
 ) -> np.ndarray:
     """Generate a piano-like tone using additive synthesis
 
-    Creates a more realistic piano sound with harmonics and envelope.
+    Creates a more realistic piano sound with harmonics and envelope
     """
-    t = np.linspace(0, duration, int(sample_rate * duration))
-
-    # Piano has multiple harmonics with different amplitudes
-    # Fundamental + harmonics with decreasing amplitude
-    harmonics = [
-        (1.0, 1.0),  # Fundamental
-        (2.0, 0.5),  # Octave
-        (3.0, 0.25),  # Fifth
-        (4.0, 0.125),  # Double octave
-        (5.0, 0.0625),  # Third
-    ]
-
-    signal = np.zeros_like(t)
-    for harmonic_freq, amplitude in harmonics:
-        signal += amplitude * np.sin(2 * np.pi * frequency * harmonic_freq * t)
-
-    # Apply ADSR envelope (Attack, Decay, Sustain, Release)
-    attack_time = 0.01
-    decay_time = 0.1
-    sustain_level = 0.7
-    release_time = 0.2
-
-    envelope = np.ones_like(t)
+    n_samples = int(sample_rate * duration)
+    signal = _piano_tone_numpy(
+        frequency,
+        duration,
+        n_samples,
+        velocity,
+        int(_PIANO_ATTACK_TIME * sample_rate),
+        int(_PIANO_DECAY_TIME * sample_rate),
+        int(_PIANO_RELEASE_TIME * sample_rate),
+    )
+
+    # Normalize
+    peak = np.abs(signal).max()
+    if peak > 0.0:
+        np.multiply(signal, np.float32(0.8 / peak), out=signal)
+
+    return signal
+
+
+def _piano_tone_numpy(
+    frequency: float,
+    duration: float,
+    n_samples: int,
+    velocity: float,
+    attack_samples: int,
+    decay_samples: int,
+    release_samples: int,
+) -> np.ndarray:
+    """NumPy implementation of the piano harmonic sum and ADSR envelope"""
+    t = _time_axis(duration, n_samples)
+
+    phase = np.float32(2 * np.pi * frequency) * t
+    signal = _PIANO_AMPLITUDES @ np.sin(np.outer(_PIANO_HARMONIC_FREQS, phase))
+
+    # Velocity is folded into the breakpoints, so the envelope is filled once at the
+    # sustain level and only the short attack/decay/release ramps are written over it
+    sustain = _PIANO_SUSTAIN_LEVEL * velocity
+    envelope = np.full(n_samples, sustain, dtype=np.float32)
 
     # Attack
-    attack_samples = int(attack_time * sample_rate)
     if attack_samples > 0:
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+        envelope[:attack_samples] = np.linspace(0, velocity, attack_samples, dtype=np.float32)
 
     # Decay
-    decay_samples = int(decay_time * sample_rate)
     if decay_samples > 0 and attack_samples + decay_samples < len(envelope):
         decay_start = attack_samples
         decay_end = attack_samples + decay_samples
-        envelope[decay_start:decay_end] = np.linspace(1, sustain_level, decay_samples)
-
-    # Sustain (already set)
+        envelope[decay_start:decay_end] = np.linspace(
+            velocity, sustain, decay_samples, dtype=np.float32
+        )
 
     # Release
-    release_samples = int(release_time * sample_rate)
     if release_samples > 0:
         release_start = len(envelope) - release_samples
-        envelope[release_start:] = np.linspace(sustain_level, 0, release_samples)
-
-    signal *= envelope * velocity
-
-    # Normalize
-    if np.max(np.abs(signal)) > 0:
-        signal = signal / np.max(np.abs(signal)) * 0.8
+        envelope[release_start:] = np.linspace(sustain, 0, release_samples, dtype=np.float32)
 
+    signal *= envelope
     return signal
 
 
 def generate_guitar_tone(frequency: float, duration: float, sample_rate: int = 44100) -> np.ndarray:
     """Generate a guitar-like tone"""
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    t = _time_axis(duration, int(sample_rate * duration))
 
     # Guitar has different harmonic content than piano
-    harmonics = [
-        (1.0, 1.0),
-        (2.0, 0.6),
-        (3.0, 0.4),
-        (4.0, 0.2),
-    ]
+    harmonic_freqs = np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
+    amplitudes = np.array([1.0, 0.6, 0.4, 0.2], dtype=np.float32)
 
-    signal = np.zeros_like(t)
-    for harmonic_freq, amplitude in harmonics:
-        signal += amplitude * np.sin(2 * np.pi * frequency * harmonic_freq * t)
+    phase = np.float32(2 * np.pi * frequency) * t
+    signal = amplitudes @ np.sin(np.outer(harmonic_freqs, phase))
 
     # Guitar has a pluck envelope (fast attack, slower decay)
     envelope = np.exp(-t * 2)  # Exponential decay
@@ -96,12 +127,50 @@ def generate_guitar_tone(frequency: float, duration: float, sample_rate: int = 4
     signal *= vibrato
 
     # Normalize
-    if np.max(np.abs(signal)) > 0:
-        signal = signal / np.max(np.abs(signal)) * 0.8
+    peak = np.abs(signal).max()
+    if peak > 0.0:
+        np.multiply(signal, np.float32(0.8 / peak), out=signal)
 
     return signal
 
 
+def note_to_hz(note: str) -> float:
+    """Convert a note name such as 'C4', 'F#3' or 'Bb2' to Hz (A4 = 440 Hz)
+
+    Same result as librosa.note_to_hz for these names, without importing librosa.
+    """
+    match = _NOTE_RE.match(note)
+    if match is None:
+        raise ValueError(f"Invalid note name: {note!r}")
+    letter, accidentals, octave = match.groups()
+    semitone = _PITCH_CLASSES[letter.upper()]
+    semitone += sum(1 if a in "#♯" else -1 for a in accidentals)
+    midi = 12 * (int(octave) + 1) + semitone
+    return 440.0 * 2.0 ** ((midi - 69) / 12)
+
+
+@functools.lru_cache(maxsize=256)
+def _note_tone(note: str, note_duration: float, instrument: str, sample_rate: int) -> np.ndarray:
+    """Synthesize one scale note, memoized across calls
+
+    The returned array is shared between callers and therefore read-only.
+    """
+    # Convert note name to frequency
+    freq = note_to_hz(note)
+
+    if instrument == "piano":
+        note_audio = generate_piano_tone(freq, note_duration, sample_rate)
+    elif instrument == "guitar":
+        note_audio = generate_guitar_tone(freq, note_duration, sample_rate)
+    else:
+        # Fallback to simple sine wave
+        t = _time_axis(note_duration, int(sample_rate * note_duration))
+        note_audio = 0.7 * np.sin(np.float32(2 * np.pi * freq) * t)
+
+    note_audio.setflags(write=False)
+    return note_audio
+
+
 def generate_scale_audio(
     notes: list[str],
     note_duration: float = 0.5,
@@ -119,34 +188,19 @@ def generate_scale_audio(
     Returns:
         Combined audio signal
     """
-    audio_segments = []
-
-    for note in notes:
-        # Convert note name to frequency
-        freq = librosa.note_to_hz(note)
-
-        if instrument == "piano":
-            note_audio = generate_piano_tone(freq, note_duration, sample_rate)
-        elif instrument == "guitar":
-            note_audio = generate_guitar_tone(freq, note_duration, sample_rate)
-        else:
-            # Fallback to simple sine wave
-            t = np.linspace(0, note_duration, int(sample_rate * note_duration))
-            note_audio = 0.7 * np.sin(2 * np.pi * freq * t)
-
-        audio_segments.append(note_audio)
-
-    # Add small gaps between notes
+    note_samples = int(sample_rate * note_duration)
+    # Small gaps between notes stay at zero
     gap_samples = int(0.05 * sample_rate)
-    gap = np.zeros(gap_samples)
 
-    result = []
-    for i, segment in enumerate(audio_segments):
-        result.append(segment)
-        if i < len(audio_segments) - 1:
-            result.append(gap)
+    total_samples = len(notes) * note_samples + max(len(notes) - 1, 0) * gap_samples
+    audio = np.zeros(total_samples, dtype=np.float32)
+    for i, note in enumerate(notes):
+        start = i * (note_samples + gap_samples)
+        audio[start : start + note_samples] = _note_tone(
+            note, note_duration, instrument, sample_rate
+        )
 
-    return np.concatenate(result)
+    return audio
 
 
 def generate_rhythmic_pattern(
@@ -159,43 +213,29 @@ def generate_rhythmic_pattern(
     beat_interval = 60.0 / tempo  # Time between beats in seconds
     beats_per_measure = 4
 
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    signal = np.zeros_like(t)
-
-    # Generate beats
-    beat_time = 0.0
-    beat_number = 0
-    while beat_time < duration:
-        # Strong beat (first beat of measure) vs weak beat
-        if beat_number % beats_per_measure == 0:
-            # Strong beat: higher frequency
-            beat_freq = 880  # A5
-            amplitude = 0.5
-        else:
-            # Weak beat: lower frequency
-            beat_freq = 440  # A4
-            amplitude = 0.3
-
-        # Create a short click/tick sound
-        beat_duration = 0.05
-        beat_samples = int(beat_duration * sample_rate)
-        beat_start = int(beat_time * sample_rate)
-        beat_end = min(beat_start + beat_samples, len(signal))
-
-        if beat_end > beat_start:
-            beat_t = np.linspace(0, beat_duration, beat_end - beat_start)
-            beat_signal = amplitude * np.sin(2 * np.pi * beat_freq * beat_t)
-            # Apply envelope for click sound
-            envelope = np.exp(-beat_t * 30)
-            beat_signal *= envelope
-            signal[beat_start:beat_end] += beat_signal
-
-        beat_time += beat_interval
-        beat_number += 1
+    signal = np.zeros(int(sample_rate * duration), dtype=np.float32)
+
+    # One short click/tick template per beat kind, with a click envelope
+    beat_duration = 0.05
+    beat_samples = int(beat_duration * sample_rate)
+    beat_t = _time_axis(beat_duration, beat_samples)
+    envelope = np.exp(-beat_t * 30)
+    strong = 0.5 * np.sin(2 * np.pi * 880 * beat_t) * envelope  # A5, first beat of measure
+    weak = 0.3 * np.sin(2 * np.pi * 440 * beat_t) * envelope  # A4
+
+    # Place every beat at once: one row of sample indices per beat, clipped at the end
+    n_beats = math.ceil(duration / beat_interval)
+    beat_numbers = np.arange(n_beats)
+    beat_starts = (beat_numbers * beat_interval * sample_rate).astype(np.int64)
+    templates = np.where((beat_numbers % beats_per_measure == 0)[:, None], strong, weak)
+    indices = beat_starts[:, None] + np.arange(beat_samples)
+    in_range = indices < len(signal)
+    np.add.at(signal, indices[in_range], templates[in_range])
 
     # Normalize
-    if np.max(np.abs(signal)) > 0:
-        signal = signal / np.max(np.abs(signal)) * 0.8
+    peak = np.abs(signal).max()
+    if peak > 0.0:
+        np.multiply(signal, np.float32(0.8 / peak), out=signal)
 
     return signal
 
@@ -205,6 +245,23 @@ def save_audio_file(audio: np.ndarray, file_path: Path, sample_rate: int = 44100
     sf.write(str(file_path), audio, sample_rate)
 
 
+@functools.lru_cache(maxsize=8)
+def make_sine_wav_bytes(
+    duration: float = 0.1, frequency: float = 440.0, sample_rate: int = 44100
+) -> bytes:
+    """Encode a sine wave at 0.3 amplitude as a 16-bit mono WAV, memoized across calls"""
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    pcm = (32767 * 0.3 * np.sin(2 * np.pi * frequency * t)).astype("<i2").tobytes()
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
 def create_test_audio_file(
     output_path: Path,
     audio_type: str = "scale",
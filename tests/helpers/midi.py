@@ -0,0 +1,81 @@
+"""MIDI file helpers for tests"""
+
+import functools
+import tempfile
+from pathlib import Path
+
+# Canonical [MIDI] snippets shared by the tests, so each one is parsed once per session
+ASCENDING_FIVE = """
+[MIDI]
+Tempo: 120
+Track 1:
+  C4 velocity=60 duration=0.5
+  D4 velocity=60 duration=0.5
+  E4 velocity=60 duration=0.5
+  F4 velocity=60 duration=0.5
+  G4 velocity=60 duration=0.5
+[/MIDI]
+"""
+
+SINGLE_C4 = """
+[MIDI]
+Tempo: 120
+Track 1:
+  C4 velocity=60 duration=0.5
+[/MIDI]
+"""
+
+C_MAJOR_PHRASE = """
+[MIDI]
+Tempo: 120
+Time Signature: 4/4
+Key: C major
+Track 1:
+  C4 velocity=60 duration=0.5
+  D4 velocity=60 duration=0.5
+  E4 velocity=60 duration=0.5
+  F4 velocity=60 duration=0.5
+  G4 velocity=60 duration=1.0
+[/MIDI]
+"""
+
+C4_D4 = """
+[MIDI]
+Tempo: 120
+Track 1:
+  C4 velocity=60 duration=0.5
+  D4 velocity=60 duration=0.5
+[/MIDI]
+"""
+
+C_MAJOR_SCALE = """
+[MIDI]
+Tempo: 120
+Time Signature: 4/4
+Key: C major
+Track 1:
+  C4 velocity=60 duration=0.5
+  D4 velocity=60 duration=0.5
+  E4 velocity=60 duration=0.5
+  F4 velocity=60 duration=0.5
+  G4 velocity=60 duration=0.5
+  A4 velocity=60 duration=0.5
+  B4 velocity=60 duration=0.5
+  C5 velocity=60 duration=1.0
+[/MIDI]
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def midi_text_to_bytes(midi_text: str) -> bytes:
+    """Contents of the .mid file written for midi_text, memoized across calls
+
+    Parsing through music21 is the slow part, so each distinct text is converted
+    once per session and tests write the cached bytes to their own paths.
+    """
+    from zikos.mcp.tools.processing.midi.midi_parser import midi_text_to_file
+
+    with tempfile.TemporaryDirectory() as tmp:
+        midi_path = Path(tmp) / "score.mid"
+        midi_text_to_file(midi_text, midi_path)
+        return midi_path.read_bytes()
@@ -0,0 +1,31 @@
+"""Shared validation of the tool schemas the MCP server hands to the LLM."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, TypeAdapter
+
+
+class _Parameters(BaseModel):
+    type: Literal["object"]
+    properties: dict[str, Any]
+    required: list[str]
+
+
+class _Function(BaseModel):
+    name: str
+    description: str
+    parameters: _Parameters
+
+
+class _Tool(BaseModel):
+    type: Literal["function"]
+    function: _Function
+
+
+# Built once at import; validation errors report the failing tool index and field path
+TOOL_SCHEMAS = TypeAdapter(list[_Tool])
+
+
+def validate_tool_schemas(tools: Any) -> None:
+    """Raise pydantic.ValidationError unless tools is a list of well-formed tool schemas."""
+    TOOL_SCHEMAS.validate_python(tools)
@@ -0,0 +1,34 @@
+"""In-process WebSocket clients for tests"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from httpx import AsyncClient
+from httpx_ws import AsyncWebSocketSession, aconnect_ws
+from httpx_ws.transport import ASGIWebSocketTransport
+
+
+@asynccontextmanager
+async def ws_client() -> AsyncIterator[AsyncClient]:
+    """Async test client that can also open WebSockets in-process
+
+    WebSocket frames go straight through the event loop instead of the thread
+    portal TestClient.websocket_connect uses. Like the client fixture, it does
+    not run the app lifespan.
+
+    The transport opens a cancel scope, so it must be entered and exited in the
+    same task: enter it in the test body rather than from an async fixture.
+    """
+    from zikos.main import app
+
+    async with AsyncClient(
+        transport=ASGIWebSocketTransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@asynccontextmanager
+async def chat_ws() -> AsyncIterator[AsyncWebSocketSession]:
+    """Chat WebSocket on its own in-process client, entered from the test body"""
+    async with ws_client() as client, aconnect_ws("http://test/api/chat/ws", client) as websocket:
+        yield websocket
@@ -1,133 +1,71 @@
 """Integration tests for audio API"""
 
+import io
+import uuid
+from unittest.mock import patch
+
 import pytest
-from fastapi.testclient import TestClient
 
-from zikos.main import app
+from zikos.api.audio import audio_service
+from zikos.config import settings
 
 pytestmark = pytest.mark.integration
 
 
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def seeded_audio_id(tmp_path_factory, sine_wav_bytes):
+    """Store one WAV for the read-only endpoint tests and point audio storage at it
+
+    The storage patches stay active until the end of the module.
+    """
+    storage_path = tmp_path_factory.mktemp("storage")
+    audio_file_id = f"seed-{uuid.uuid4().hex}"
+    (storage_path / f"{audio_file_id}.wav").write_bytes(sine_wav_bytes)
+
+    with (
+        patch.object(settings, "audio_storage_path", storage_path),
+        patch.object(audio_service, "storage_path", storage_path),
+    ):
+        yield audio_file_id
 
 
 class TestAudioAPI:
     """Tests for audio API endpoints"""
 
-    def test_upload_audio(self, client, temp_dir):
+    @pytest.mark.parametrize(
+        "recording_id", ["test_recording", None], ids=["with_recording_id", "no_recording_id"]
+    )
+    async def test_upload_audio(self, aclient, sine_wav_bytes, recording_id):
         """Test uploading audio file with real implementation"""
-        import math
-        import wave
-        from pathlib import Path
-
-        sample_rate = 44100
-        duration = 0.1
-        frequency = 440.0
-
-        audio_data = b""
-        for i in range(int(sample_rate * duration)):
-            t = i / sample_rate
-            sample = int(32767 * 0.3 * math.sin(2 * math.pi * frequency * t))
-            audio_data += sample.to_bytes(2, byteorder="little", signed=True)
-
-        test_wav = temp_dir / "test_upload.wav"
-        with wave.open(str(test_wav), "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data)
-
-        with open(test_wav, "rb") as f:
-            response = client.post(
-                "/api/audio/upload",
-                files={"file": ("test.wav", f.read(), "audio/wav")},
-                data={"recording_id": "test_recording"},
-            )
+        response = await aclient.post(
+            "/api/audio/upload",
+            files={"file": ("test.wav", io.BytesIO(sine_wav_bytes), "audio/wav")},
+            data={"recording_id": recording_id} if recording_id else None,
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert "audio_file_id" in data
         assert data["audio_file_id"] != ""
         assert "recording_id" in data
-        assert data.get("recording_id") == "test_recording" or data.get("recording_id") is None
+        assert data.get("recording_id") in (recording_id, None)
         assert "analysis" in data
         assert "tempo" in data["analysis"]
         assert "pitch" in data["analysis"]
         assert "rhythm" in data["analysis"]
 
-    def test_upload_audio_without_recording_id(self, client, temp_dir):
-        """Test uploading audio without recording ID"""
-        import math
-        import wave
-        from pathlib import Path
-
-        sample_rate = 44100
-        duration = 0.1
-        frequency = 440.0
-
-        audio_data = b""
-        for i in range(int(sample_rate * duration)):
-            t = i / sample_rate
-            sample = int(32767 * 0.3 * math.sin(2 * math.pi * frequency * t))
-            audio_data += sample.to_bytes(2, byteorder="little", signed=True)
-
-        test_wav = temp_dir / "test_upload2.wav"
-        with wave.open(str(test_wav), "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data)
-
-        with open(test_wav, "rb") as f:
-            response = client.post(
-                "/api/audio/upload",
-                files={"file": ("test.wav", f.read(), "audio/wav")},
-            )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "audio_file_id" in data
-
-    def test_get_audio_info(self, client, storage_paths):
+    async def test_get_audio_info(self, aclient, seeded_audio_id):
         """Test getting audio info with real implementation"""
-        import math
-        import uuid
-        import wave
-        from pathlib import Path
-
-        audio_file_id = str(uuid.uuid4())
-        audio_path = storage_paths / f"{audio_file_id}.wav"
-        audio_path.parent.mkdir(parents=True, exist_ok=True)
-
-        sample_rate = 44100
-        duration = 0.1
-        frequency = 440.0
-
-        audio_data = b""
-        for i in range(int(sample_rate * duration)):
-            t = i / sample_rate
-            sample = int(32767 * 0.3 * math.sin(2 * math.pi * frequency * t))
-            audio_data += sample.to_bytes(2, byteorder="little", signed=True)
-
-        with wave.open(str(audio_path), "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data)
-
-        response = client.get(f"/api/audio/{audio_file_id}/info")
+        response = await aclient.get(f"/api/audio/{seeded_audio_id}/info")
 
         assert response.status_code == 200
         data = response.json()
         assert "duration" in data
         assert "sample_rate" in data
 
-    def test_get_audio_info_not_found(self, client):
+    async def test_get_audio_info_not_found(self, aclient):
         """Test getting audio info for non-existent file"""
-        response = client.get("/api/audio/nonexistent_audio_id_12345/info")
+        response = await aclient.get("/api/audio/nonexistent_audio_id_12345/info")
 
         assert response.status_code == 200
         data = response.json()
@@ -135,44 +73,18 @@ class TestAudioAPI:
         assert data["error"] is True
         assert data["error_type"] == "FILE_NOT_FOUND"
 
-    def test_get_audio_file(self, client, storage_paths):
+    async def test_get_audio_file(self, aclient, seeded_audio_id):
         """Test getting audio file with real implementation"""
-        import math
-        import uuid
-        import wave
-        from pathlib import Path
-
-        audio_file_id = str(uuid.uuid4())
-        audio_path = storage_paths / f"{audio_file_id}.wav"
-        audio_path.parent.mkdir(parents=True, exist_ok=True)
-
-        sample_rate = 44100
-        duration = 0.1
-        frequency = 440.0
-
-        audio_data = b""
-        for i in range(int(sample_rate * duration)):
-            t = i / sample_rate
-            sample = int(32767 * 0.3 * math.sin(2 * math.pi * frequency * t))
-            audio_data += sample.to_bytes(2, byteorder="little", signed=True)
-
-        with wave.open(str(audio_path), "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data)
-
-        response = client.get(f"/api/audio/{audio_file_id}")
-
-        assert response.status_code == 200
-        assert (
-            "audio" in response.headers["content-type"]
-            or "application" in response.headers["content-type"]
-        )
-        assert len(response.content) > 0
-
-    def test_get_audio_file_not_found(self, client):
+        # Stream the body and only inspect the first chunk instead of loading the whole file
+        async with aclient.stream("GET", f"/api/audio/{seeded_audio_id}") as response:
+            assert response.status_code == 200
+            content_type = response.headers.get("content-type", "")
+            assert content_type.startswith(("audio/", "application/"))
+            first_chunk = await anext(response.aiter_bytes(chunk_size=4096))
+            assert len(first_chunk) > 0
+
+    async def test_get_audio_file_not_found(self, aclient):
         """Test getting non-existent audio file"""
-        response = client.get("/api/audio/nonexistent_audio_id")
+        response = await aclient.get("/api/audio/nonexistent_audio_id")
 
         assert response.status_code == 404
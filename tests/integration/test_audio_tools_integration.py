@@ -4,13 +4,27 @@ These tests use real libraries (librosa, soundfile) instead of mocks to verify
 that the integration works correctly with actual library behavior.
 """
 
+import asyncio
+import functools
 from pathlib import Path
 
 import numpy as np
 import pytest
 import soundfile as sf
 
-from zikos.mcp.tools.audio import AudioAnalysisTools
+from zikos.mcp.tools.audio import AudioAnalysisTools, rhythm, tempo
+from zikos.mcp.tools.audio.utils import load_audio
+
+pytestmark = pytest.mark.slow
+
+
+@functools.lru_cache(maxsize=32)
+def _sine(frequency: float, sample_rate: int, duration: float) -> np.ndarray:
+    """Unit float32 sine wave, memoized across fixtures and therefore read-only"""
+    t = np.arange(int(duration * sample_rate), dtype=np.float32) / np.float32(sample_rate)
+    sine = np.sin(np.float32(2 * np.pi * frequency) * t)
+    sine.setflags(write=False)
+    return sine
 
 
 def generate_test_audio(
@@ -33,18 +47,16 @@ def generate_test_audio(
         Path to the generated audio file
     """
     samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, samples)
-
-    audio = np.sin(2 * np.pi * frequency * t)
+    # Copy, so the beats can be written without touching the cached wave
+    audio = _sine(frequency, sample_rate, duration).copy()
 
     if tempo_bpm:
         beat_interval = 60.0 / tempo_bpm
         beat_samples = int(beat_interval * sample_rate)
-        for i in range(0, samples, beat_samples):
-            if i < samples:
-                audio[i : min(i + int(0.01 * sample_rate), samples)] *= 2.0
+        beat_starts = np.arange(0, samples, beat_samples)
+        beat_indices = beat_starts[:, None] + np.arange(int(0.01 * sample_rate))
+        audio[beat_indices[beat_indices < samples]] *= 2.0
 
-    audio = audio.astype(np.float32)
     sf.write(str(output_path), audio, sample_rate)
     return output_path
 
@@ -55,100 +67,125 @@ def audio_tools():
     return AudioAnalysisTools()
 
 
-@pytest.fixture
-def test_audio_440hz(temp_dir):
+@pytest.fixture(scope="session")
+def audio_fixture_dir(tmp_path_factory):
+    """Directory holding the generated audio files, shared by the whole session
+
+    The analysis tools only read these files, so each one is synthesized once.
+    """
+    return tmp_path_factory.mktemp("audio")
+
+
+@pytest.fixture(scope="session")
+def test_audio_440hz(audio_fixture_dir):
     """Generate a 2-second audio file with 440 Hz tone (A4)"""
-    audio_path = temp_dir / "test_440hz.wav"
+    audio_path = audio_fixture_dir / "test_440hz.wav"
     generate_test_audio(audio_path, duration=2.0, frequency=440.0)
     return audio_path
 
 
-@pytest.fixture
-def test_audio_120bpm(temp_dir):
+@pytest.fixture(scope="session")
+def test_audio_120bpm(audio_fixture_dir):
     """Generate a 4-second audio file with beats at 120 BPM"""
-    audio_path = temp_dir / "test_120bpm.wav"
+    audio_path = audio_fixture_dir / "test_120bpm.wav"
     generate_test_audio(audio_path, duration=4.0, frequency=440.0, tempo_bpm=120.0)
     return audio_path
 
 
-@pytest.fixture
-def test_audio_short(temp_dir):
+@pytest.fixture(scope="session")
+def test_audio_short(audio_fixture_dir):
     """Generate a very short audio file (< 0.5 seconds)"""
-    audio_path = temp_dir / "test_short.wav"
+    audio_path = audio_fixture_dir / "test_short.wav"
     generate_test_audio(audio_path, duration=0.2, frequency=440.0)
     return audio_path
 
 
-@pytest.fixture
-def test_audio_multiple_frequencies(temp_dir):
+@pytest.fixture(scope="session")
+def test_audio_multiple_frequencies(audio_fixture_dir):
     """Generate audio with multiple frequencies (chord-like)"""
-    audio_path = temp_dir / "test_chord.wav"
+    audio_path = audio_fixture_dir / "test_chord.wav"
     duration = 3.0
     sample_rate = 22050
-    samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, samples)
 
     audio = (
-        np.sin(2 * np.pi * 261.63 * t)
-        + np.sin(2 * np.pi * 329.63 * t)  # C4
-        + np.sin(2 * np.pi * 392.00 * t)  # E4  # G4
-    ) / 3.0
+        _sine(261.63, sample_rate, duration)  # C4
+        + _sine(329.63, sample_rate, duration)  # E4
+        + _sine(392.00, sample_rate, duration)  # G4
+    ) / np.float32(3.0)
 
-    audio = audio.astype(np.float32)
     sf.write(str(audio_path), audio, sample_rate)
     return audio_path
 
 
-@pytest.fixture
-def test_audio_variable_tempo(temp_dir):
+@pytest.fixture(scope="session")
+def test_audio_variable_tempo(audio_fixture_dir):
     """Generate audio with variable tempo (accelerando)"""
-    audio_path = temp_dir / "test_variable_tempo.wav"
+    audio_path = audio_fixture_dir / "test_variable_tempo.wav"
     duration = 6.0
     sample_rate = 22050
     samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, samples)
 
-    audio = np.sin(2 * np.pi * 440.0 * t)
+    audio = _sine(440.0, sample_rate, duration).copy()
 
     beat_interval_start = 60.0 / 100.0
     beat_interval_end = 60.0 / 150.0
 
-    for i in range(samples):
-        progress = i / samples
-        current_interval = beat_interval_start * (1 - progress) + beat_interval_end * progress
-        if i % int(current_interval * sample_rate) < int(0.01 * sample_rate):
-            audio[i] *= 2.0
+    sample_indices = np.arange(samples)
+    progress = sample_indices / samples
+    current_interval = beat_interval_start * (1 - progress) + beat_interval_end * progress
+    interval_samples = (current_interval * sample_rate).astype(np.int64)
+    audio[sample_indices % interval_samples < int(0.01 * sample_rate)] *= 2.0
 
-    audio = audio.astype(np.float32)
     sf.write(str(audio_path), audio, sample_rate)
     return audio_path
 
 
-@pytest.fixture
-def test_audio_stereo(temp_dir):
+@pytest.fixture(scope="session")
+def test_audio_stereo(audio_fixture_dir):
     """Generate stereo audio file"""
-    audio_path = temp_dir / "test_stereo.wav"
+    audio_path = audio_fixture_dir / "test_stereo.wav"
     duration = 2.0
     sample_rate = 22050
-    samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, samples)
 
-    left = np.sin(2 * np.pi * 440.0 * t)
-    right = np.sin(2 * np.pi * 523.25 * t)
-    audio = np.column_stack([left, right]).astype(np.float32)
+    left = _sine(440.0, sample_rate, duration)
+    right = _sine(523.25, sample_rate, duration)
+    audio = np.column_stack([left, right])
 
     sf.write(str(audio_path), audio, sample_rate)
     return audio_path
 
 
+async def _analyze_120bpm(audio_path: Path) -> dict[str, dict]:
+    y, sr = load_audio(audio_path)
+    tempo_result, rhythm_result = await asyncio.gather(
+        asyncio.to_thread(tempo.analyze_tempo_array, y, sr),
+        asyncio.to_thread(rhythm.analyze_rhythm_array, y, sr),
+    )
+    return {"tempo": tempo_result, "rhythm": rhythm_result}
+
+
+@pytest.fixture(scope="module")
+def results_120bpm(test_audio_120bpm):
+    """Real tempo and rhythm analysis of the 120 BPM file from a single decode
+
+    Run once and shared by tests that only read the results.
+    """
+    return asyncio.run(_analyze_120bpm(test_audio_120bpm))
+
+
+@pytest.fixture(scope="module")
+def pitch_result_440hz(test_audio_440hz):
+    """Real pitch detection on the 440 Hz file, run once and shared by tests that only read it"""
+    return asyncio.run(AudioAnalysisTools().detect_pitch(audio_path=str(test_audio_440hz)))
+
+
 class TestTempoAnalysisIntegration:
     """Integration tests for tempo analysis with real librosa"""
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_analyze_tempo_real_audio(self, audio_tools, test_audio_120bpm):
+    def test_analyze_tempo_real_audio(self, results_120bpm):
         """Test tempo analysis with real audio file and librosa"""
-        result = await audio_tools.analyze_tempo(audio_path=str(test_audio_120bpm))
+        result = results_120bpm["tempo"]
 
         assert "error" not in result
         assert "bpm" in result
@@ -191,10 +228,9 @@ class TestTempoAnalysisIntegration:
         assert isinstance(result["tempo_changes"], list)
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_analyze_tempo_stability_calculation(self, audio_tools, test_audio_120bpm):
+    def test_analyze_tempo_stability_calculation(self, results_120bpm):
         """Test that tempo stability is calculated correctly"""
-        result = await audio_tools.analyze_tempo(audio_path=str(test_audio_120bpm))
+        result = results_120bpm["tempo"]
 
         assert "tempo_stability_score" in result
         assert 0.0 <= result["tempo_stability_score"] <= 1.0
@@ -204,10 +240,9 @@ class TestPitchDetectionIntegration:
     """Integration tests for pitch detection with real librosa"""
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_detect_pitch_real_audio(self, audio_tools, test_audio_440hz):
+    def test_detect_pitch_real_audio(self, pitch_result_440hz):
         """Test pitch detection with real audio file and librosa"""
-        result = await audio_tools.detect_pitch(audio_path=str(test_audio_440hz))
+        result = pitch_result_440hz
 
         assert "error" not in result
         assert "notes" in result
@@ -250,19 +285,17 @@ class TestPitchDetectionIntegration:
         assert "intonation_accuracy" in result
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_detect_pitch_key_detection(self, audio_tools, test_audio_440hz):
+    def test_detect_pitch_key_detection(self, pitch_result_440hz):
         """Test that key detection works with real librosa chroma"""
-        result = await audio_tools.detect_pitch(audio_path=str(test_audio_440hz))
+        result = pitch_result_440hz
 
         assert "detected_key" in result
         assert isinstance(result["detected_key"], str)
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_detect_pitch_note_segmentation(self, audio_tools, test_audio_440hz):
+    def test_detect_pitch_note_segmentation(self, pitch_result_440hz):
         """Test that note segmentation works correctly"""
-        result = await audio_tools.detect_pitch(audio_path=str(test_audio_440hz))
+        result = pitch_result_440hz
 
         if len(result.get("notes", [])) > 0:
             note = result["notes"][0]
@@ -278,10 +311,9 @@ class TestRhythmAnalysisIntegration:
     """Integration tests for rhythm analysis with real librosa"""
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_analyze_rhythm_real_audio(self, audio_tools, test_audio_120bpm):
+    def test_analyze_rhythm_real_audio(self, results_120bpm):
         """Test rhythm analysis with real audio file and librosa"""
-        result = await audio_tools.analyze_rhythm(audio_path=str(test_audio_120bpm))
+        result = results_120bpm["rhythm"]
 
         assert "error" not in result
         assert "onsets" in result
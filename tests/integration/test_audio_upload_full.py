@@ -4,57 +4,28 @@ These tests use REAL audio files and REAL analysis - no mocks.
 Run with: pytest tests/integration/test_audio_upload_full.py -v
 """
 
-import json
-import math
-import wave
-from pathlib import Path
+import io
 
 import pytest
-from fastapi.testclient import TestClient
 
-from zikos.main import app
+from tests.helpers.audio_synthesis import make_sine_wav_bytes
+from tests.helpers.websocket import chat_ws, ws_client
 
-pytestmark = pytest.mark.integration
-
-
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
-
-
-def create_test_audio_file(temp_dir: Path, duration: float = 1.0, frequency: float = 440.0) -> Path:
-    """Create a real WAV file for testing"""
-    sample_rate = 44100
-    audio_data = b""
-    for i in range(int(sample_rate * duration)):
-        t = i / sample_rate
-        sample = int(32767 * 0.3 * math.sin(2 * math.pi * frequency * t))
-        audio_data += sample.to_bytes(2, byteorder="little", signed=True)
-
-    test_wav = temp_dir / "test_audio.wav"
-    with wave.open(str(test_wav), "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_data)
-
-    return test_wav
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
 
 
 class TestAudioUploadFullFlow:
     """REAL integration tests for complete audio upload flow"""
 
-    def test_upload_and_analyze_real_audio(self, client, temp_dir):
+    def test_upload_and_analyze_real_audio(self, client):
         """Test uploading real audio and getting analysis"""
-        audio_file = create_test_audio_file(temp_dir, duration=1.0, frequency=440.0)
+        audio_data = make_sine_wav_bytes(duration=1.0, frequency=440.0)
 
-        with open(audio_file, "rb") as f:
-            response = client.post(
-                "/api/audio/upload",
-                files={"file": ("test.wav", f.read(), "audio/wav")},
-                data={"recording_id": "test_recording"},
-            )
+        response = client.post(
+            "/api/audio/upload",
+            files={"file": ("test.wav", io.BytesIO(audio_data), "audio/wav")},
+            data={"recording_id": "test_recording"},
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -65,19 +36,19 @@ class TestAudioUploadFullFlow:
         assert "rhythm" in data["analysis"]
 
     @pytest.mark.comprehensive
-    def test_websocket_audio_ready_with_real_audio(self, client, temp_dir):
+    async def test_websocket_audio_ready_with_real_audio(self):
         """Test complete WebSocket flow with real audio upload and analysis
 
         This test makes real LLM calls which can take a very long time.
         Marked as expensive to skip by default.
         """
         # First upload real audio
-        audio_file = create_test_audio_file(temp_dir, duration=1.0, frequency=440.0)
+        audio_data = make_sine_wav_bytes(duration=1.0, frequency=440.0)
 
-        with open(audio_file, "rb") as f:
-            upload_response = client.post(
+        async with ws_client() as client:
+            upload_response = await client.post(
                 "/api/audio/upload",
-                files={"file": ("test.wav", f.read(), "audio/wav")},
+                files={"file": ("test.wav", io.BytesIO(audio_data), "audio/wav")},
                 data={"recording_id": "test_recording"},
             )
 
@@ -86,8 +57,8 @@ class TestAudioUploadFullFlow:
         audio_file_id = upload_data["audio_file_id"]
 
         # Now test WebSocket audio_ready
-        with client.websocket_connect("/api/chat/ws") as websocket:
-            websocket.send_json(
+        async with chat_ws() as websocket:
+            await websocket.send_json(
                 {
                     "type": "audio_ready",
                     "audio_file_id": audio_file_id,
@@ -97,23 +68,23 @@ class TestAudioUploadFullFlow:
             )
 
             # Should get a response (might be error if LLM not available, but should not crash)
-            response = websocket.receive_json()
+            response = await websocket.receive_json()
 
-            assert "type" in response
-            # Should be either "response" or "error" - both are valid
-            assert response["type"] in ["response", "error"]
+        assert "type" in response
+        # Should be either "response" or "error" - both are valid
+        assert response["type"] in ["response", "error"]
 
-            if response["type"] == "error":
-                # If error, check it's a meaningful error, not a crash
-                assert "message" in response
-                error_msg = response["message"].lower()
-                # Should mention LLM or model, not be a generic crash
-                assert any(keyword in error_msg for keyword in ["llm", "model", "available"])
+        if response["type"] == "error":
+            # If error, check it's a meaningful error, not a crash
+            assert "message" in response
+            error_msg = response["message"].lower()
+            # Should mention LLM or model, not be a generic crash
+            assert any(keyword in error_msg for keyword in ["llm", "model", "available"])
 
-    def test_websocket_audio_ready_error_handling(self, client):
+    async def test_websocket_audio_ready_error_handling(self):
         """Test error handling when audio file doesn't exist"""
-        with client.websocket_connect("/api/chat/ws") as websocket:
-            websocket.send_json(
+        async with chat_ws() as websocket:
+            await websocket.send_json(
                 {
                     "type": "audio_ready",
                     "audio_file_id": "nonexistent_file_id_12345",
@@ -123,8 +94,8 @@ class TestAudioUploadFullFlow:
             )
 
             # Should get an error response, not crash
-            response = websocket.receive_json()
+            response = await websocket.receive_json()
 
-            assert "type" in response
-            assert response["type"] in ["response", "error"]
-            # Should handle the error gracefully
+        assert "type" in response
+        assert response["type"] in ["response", "error"]
+        # Should handle the error gracefully
@@ -10,37 +10,24 @@ These tests require:
 
 import pytest
 
-pytestmark = pytest.mark.comprehensive
+# Keep the real-LLM tests on one xdist worker (--dist loadgroup) so the model loads once
+pytestmark = [pytest.mark.comprehensive, pytest.mark.xdist_group("llm")]
 
 
 class TestLLMServiceIntegration:
     """Integration tests for LLM service with real llama-cpp-python"""
 
     @pytest.mark.asyncio
-    async def test_llm_initialization(self):
+    async def test_llm_initialization(self, llm_service):
         """Test LLM initialization with real model"""
-        from zikos.services.llm import LLMService
-
-        service = LLMService()
-
-        if service.llm is None:
-            pytest.skip("LLM not initialized (no model file configured)")
-
-        assert service.llm is not None
+        assert llm_service.llm is not None
 
     @pytest.mark.asyncio
-    async def test_llm_generate_response(self):
+    async def test_llm_generate_response(self, llm_service, mcp_server):
         """Test LLM response generation (comprehensive)"""
-        from zikos.mcp.server import MCPServer
-        from zikos.services.llm import LLMService
-
-        service = LLMService()
-        mcp_server = MCPServer()
-
-        if service.llm is None:
-            pytest.skip("LLM not initialized (no model file configured)")
+        llm_service.conversations.clear()
 
-        result = await service.generate_response(
+        result = await llm_service.generate_response(
             "Hello, this is a test message.",
             session_id="test_session",
             mcp_server=mcp_server,
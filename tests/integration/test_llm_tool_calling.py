@@ -4,36 +4,61 @@ These tests verify that the LLM can actually use tools correctly.
 Marked as expensive and llm - uses real LLM and real MCP server.
 """
 
+import asyncio
+
 import pytest
 
-pytestmark = pytest.mark.comprehensive
+from tests.helpers.tool_schemas import validate_tool_schemas
+
+# Keep the real-LLM tests on one xdist worker (--dist loadgroup) so the model loads once
+pytestmark = [pytest.mark.comprehensive, pytest.mark.xdist_group("llm")]
+
+
+# One prompt per test, each sent in its own session
+_PROMPTS = {
+    "metronome": "I need a metronome at 120 BPM",
+    "recording": "Let's record a sample",
+    "tools": "Hello, what tools do you have available?",
+    "loop": "Create a metronome at 100 BPM",
+    "tool_error": "Analyze tempo for audio file nonexistent123",
+}
+
+
+@pytest.fixture(scope="class")
+def tool_calling_results(llm_service, mcp_server):
+    """Send every prompt once, concurrently, and keep each result with its session history
+
+    The prompts are independent, so a backend that serves requests in parallel (a
+    llama.cpp server with several slots, or a cloud API) overlaps them. The in-process
+    llama.cpp backend serializes them on its inference lock, which costs no more than
+    running them one test at a time.
+    """
+    llm_service.conversations.clear()
+
+    async def run_all():
+        return await asyncio.gather(
+            *(
+                llm_service.generate_response(
+                    prompt, session_id=f"test_{name}", mcp_server=mcp_server
+                )
+                for name, prompt in _PROMPTS.items()
+            )
+        )
+
+    results = asyncio.run(run_all())
+    return {
+        name: (result, list(llm_service.conversations.get(f"test_{name}", [])))
+        for name, result in zip(_PROMPTS, results, strict=True)
+    }
 
 
 class TestLLMToolCallingIntegration:
     """Integration tests for LLM tool calling with real components"""
 
-    @pytest.mark.asyncio
-    async def test_llm_can_call_metronome_tool(self):
+    def test_llm_can_call_metronome_tool(self, tool_calling_results):
         """Test that LLM can call the metronome tool when requested"""
-        from zikos.mcp.server import MCPServer
-        from zikos.services.llm import LLMService
-
-        service = LLMService()
-        mcp_server = MCPServer()
-
-        if service.llm is None:
-            pytest.skip("LLM not initialized (no model file configured)")
-
-        # Clear any existing conversation
-        session_id = "test_session"
-        service.conversations.clear()
-
         # Request metronome - should trigger tool call
-        result = await service.generate_response(
-            "I need a metronome at 120 BPM",
-            session_id=session_id,
-            mcp_server=mcp_server,
-        )
+        result, _ = tool_calling_results["metronome"]
 
         assert "type" in result
         # Should either call the tool directly (via pre-detection) or via LLM
@@ -51,27 +76,10 @@ class TestLLMToolCallingIntegration:
             # If it's a response, it should at least acknowledge the request
             assert len(message) > 0
 
-    @pytest.mark.asyncio
-    async def test_llm_can_call_recording_tool(self):
+    def test_llm_can_call_recording_tool(self, tool_calling_results):
         """Test that LLM can call the recording tool when requested"""
-        from zikos.mcp.server import MCPServer
-        from zikos.services.llm import LLMService
-
-        service = LLMService()
-        mcp_server = MCPServer()
-
-        if service.llm is None:
-            pytest.skip("LLM not initialized (no model file configured)")
-
-        session_id = "test_session"
-        service.conversations.clear()
-
         # Request recording - should trigger tool call
-        result = await service.generate_response(
-            "Let's record a sample",
-            session_id=session_id,
-            mcp_server=mcp_server,
-        )
+        result, _ = tool_calling_results["recording"]
 
         assert "type" in result
         if result["type"] == "tool_call":
@@ -83,105 +91,43 @@ class TestLLMToolCallingIntegration:
             message = result.get("message", "").lower()
             assert len(message) > 0
 
-    @pytest.mark.asyncio
-    async def test_llm_tool_schemas_are_valid(self):
+    def test_llm_tool_schemas_are_valid(self, mcp_server, tool_calling_results):
         """Test that tool schemas are properly formatted for the LLM"""
-        from zikos.mcp.server import MCPServer
-        from zikos.services.llm import LLMService
-
-        service = LLMService()
-        mcp_server = MCPServer()
-
-        if service.llm is None:
-            pytest.skip("LLM not initialized (no model file configured)")
-
         tools = mcp_server.get_tools()
 
         # Verify tools are in correct format
         assert isinstance(tools, list)
         assert len(tools) > 0
 
-        for tool in tools:
-            assert "type" in tool
-            assert tool["type"] == "function"
-            assert "function" in tool
-            assert "name" in tool["function"]
-            assert "description" in tool["function"]
-            assert "parameters" in tool["function"]
-            assert "type" in tool["function"]["parameters"]
-            assert tool["function"]["parameters"]["type"] == "object"
+        validate_tool_schemas(tools)
 
         # Test that LLM can accept these tools
-        # Create a simple test message
-        session_id = "test_session"
-        service.conversations.clear()
-
         # This should not crash even if LLM doesn't call tools
-        result = await service.generate_response(
-            "Hello, what tools do you have available?",
-            session_id=session_id,
-            mcp_server=mcp_server,
-        )
+        result, _ = tool_calling_results["tools"]
 
         assert "type" in result
         assert result["type"] in ["response", "tool_call"]
 
-    @pytest.mark.asyncio
-    async def test_llm_tool_calling_loop(self):
+    def test_llm_tool_calling_loop(self, tool_calling_results):
         """Test that tool calling loop works correctly"""
-        from zikos.mcp.server import MCPServer
-        from zikos.services.llm import LLMService
-
-        service = LLMService()
-        mcp_server = MCPServer()
-
-        if service.llm is None:
-            pytest.skip("LLM not initialized (no model file configured)")
-
-        session_id = "test_session"
-        service.conversations.clear()
-
         # Request something that should trigger a tool call
         # Use a clear, direct request
-        result = await service.generate_response(
-            "Create a metronome at 100 BPM",
-            session_id=session_id,
-            mcp_server=mcp_server,
-        )
+        result, history = tool_calling_results["loop"]
 
         assert "type" in result
 
         # Check conversation history was updated
-        assert session_id in service.conversations
-        history = service.conversations[session_id]
         assert len(history) > 0  # Should have at least system prompt
 
         # Check that user message was added
         user_messages = [msg for msg in history if msg.get("role") == "user"]
         assert len(user_messages) > 0
 
-    @pytest.mark.asyncio
-    async def test_llm_handles_tool_errors_gracefully(self):
+    def test_llm_handles_tool_errors_gracefully(self, tool_calling_results):
         """Test that LLM handles tool errors without crashing"""
-        from zikos.mcp.server import MCPServer
-        from zikos.services.llm import LLMService
-
-        service = LLMService()
-        mcp_server = MCPServer()
-
-        if service.llm is None:
-            pytest.skip("LLM not initialized (no model file configured)")
-
-        session_id = "test_session"
-        service.conversations.clear()
-
         # Try to call a tool with invalid arguments (if LLM tries)
         # This tests error handling in the tool calling loop
-        result = await service.generate_response(
-            "Analyze tempo for audio file nonexistent123",
-            session_id=session_id,
-            mcp_server=mcp_server,
-        )
+        result, _ = tool_calling_results["tool_error"]
 
         # Should not crash - should return either tool_call or response
         assert "type" in result
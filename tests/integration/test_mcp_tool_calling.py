@@ -7,6 +7,8 @@ functionality and LLM integration.
 
 import pytest
 
+from tests.helpers.tool_schemas import validate_tool_schemas
+
 pytestmark = pytest.mark.integration
 
 
@@ -14,140 +16,84 @@ class TestMCPToolCalling:
     """Tests for MCP server tool calling"""
 
     @pytest.mark.asyncio
-    async def test_metronome_tool_call(self):
-        """Test calling metronome tool directly"""
-        from zikos.mcp.server import MCPServer
-
-        mcp_server = MCPServer()
-
-        result = await mcp_server.call_tool(
-            "create_metronome", bpm=120, time_signature="4/4", description="Test metronome"
-        )
-
-        assert isinstance(result, dict)
-        assert result["status"] == "metronome_created"
-        assert result["bpm"] == 120
-        assert result["time_signature"] == "4/4"
-        assert "metronome_id" in result
-
-    @pytest.mark.asyncio
-    async def test_recording_tool_call(self):
-        """Test calling recording tool directly"""
-        from zikos.mcp.server import MCPServer
-
-        mcp_server = MCPServer()
-
-        result = await mcp_server.call_tool(
-            "request_audio_recording", prompt="Test recording", max_duration=60.0
-        )
-
-        assert isinstance(result, dict)
-        assert result["status"] == "recording_requested"
-        assert result["prompt"] == "Test recording"
-        assert result["max_duration"] == 60.0
-        assert "recording_id" in result
-
-    @pytest.mark.asyncio
-    async def test_tuner_tool_call(self):
-        """Test calling tuner tool directly"""
-        from zikos.mcp.server import MCPServer
-
-        mcp_server = MCPServer()
-
-        result = await mcp_server.call_tool(
-            "create_tuner", reference_frequency=440.0, note="A", octave=4
-        )
+    @pytest.mark.parametrize(
+        ("tool_name", "arguments", "expected", "id_key"),
+        [
+            (
+                "create_metronome",
+                {"bpm": 120, "time_signature": "4/4", "description": "Test metronome"},
+                {"status": "metronome_created", "bpm": 120, "time_signature": "4/4"},
+                "metronome_id",
+            ),
+            (
+                "request_audio_recording",
+                {"prompt": "Test recording", "max_duration": 60.0},
+                {"status": "recording_requested", "prompt": "Test recording", "max_duration": 60.0},
+                "recording_id",
+            ),
+            (
+                "create_tuner",
+                {"reference_frequency": 440.0, "note": "A", "octave": 4},
+                {"status": "tuner_created", "reference_frequency": 440.0, "note": "A", "octave": 4},
+                "tuner_id",
+            ),
+            (
+                "create_chord_progression",
+                {
+                    "chords": ["C", "G", "Am", "F"],
+                    "tempo": 120,
+                    "time_signature": "4/4",
+                    "chords_per_bar": 1,
+                    "instrument": "piano",
+                },
+                {
+                    "status": "chord_progression_created",
+                    "chords": ["C", "G", "Am", "F"],
+                    "tempo": 120,
+                },
+                "progression_id",
+            ),
+        ],
+        ids=["metronome", "recording", "tuner", "chord_progression"],
+    )
+    async def test_tool_call(self, mcp_server, tool_name, arguments, expected, id_key):
+        """Test calling a widget tool directly"""
+        result = await mcp_server.call_tool(tool_name, **arguments)
 
         assert isinstance(result, dict)
-        assert result["status"] == "tuner_created"
-        assert result["reference_frequency"] == 440.0
-        assert result["note"] == "A"
-        assert result["octave"] == 4
-        assert "tuner_id" in result
+        for key, value in expected.items():
+            assert result[key] == value
+        assert id_key in result
 
     @pytest.mark.asyncio
-    async def test_chord_progression_tool_call(self):
-        """Test calling chord progression tool directly"""
-        from zikos.mcp.server import MCPServer
-
-        mcp_server = MCPServer()
-
-        result = await mcp_server.call_tool(
-            "create_chord_progression",
-            chords=["C", "G", "Am", "F"],
-            tempo=120,
-            time_signature="4/4",
-            chords_per_bar=1,
-            instrument="piano",
-        )
-
-        assert isinstance(result, dict)
-        assert result["status"] == "chord_progression_created"
-        assert result["chords"] == ["C", "G", "Am", "F"]
-        assert result["tempo"] == 120
-        assert "progression_id" in result
-
-    @pytest.mark.asyncio
-    async def test_unknown_tool_error(self):
+    async def test_unknown_tool_error(self, mcp_server):
         """Test that unknown tools raise appropriate errors"""
-        from zikos.mcp.server import MCPServer
-
-        mcp_server = MCPServer()
-
         with pytest.raises(ValueError, match="Unknown tool"):
             await mcp_server.call_tool("nonexistent_tool", arg1="value")
 
     @pytest.mark.asyncio
-    async def test_tool_schemas_format(self):
+    async def test_tool_schemas_format(self, mcp_server):
         """Test that tool schemas are properly formatted"""
-        from zikos.mcp.server import MCPServer
-
-        mcp_server = MCPServer()
-
         tools = mcp_server.get_tools()
 
         assert isinstance(tools, list)
         assert len(tools) > 0
 
-        # Verify schema structure
-        for tool in tools:
-            assert "type" in tool
-            assert tool["type"] == "function"
-            assert "function" in tool
-
-            func = tool["function"]
-            assert "name" in func
-            assert "description" in func
-            assert "parameters" in func
-
-            params = func["parameters"]
-            assert "type" in params
-            assert params["type"] == "object"
-            assert "properties" in params
-            assert "required" in params
+        validate_tool_schemas(tools)
 
     @pytest.mark.asyncio
-    async def test_audio_analysis_tool_with_synthesized_audio(self, temp_dir):
+    async def test_audio_analysis_tool_with_synthesized_audio(self, mcp_server, storage_paths):
         """Test audio analysis tool with real synthesized audio"""
-        from pathlib import Path
+        import uuid
 
         from tests.helpers.audio_synthesis import create_test_audio_file
-        from zikos.mcp.server import MCPServer
-
-        mcp_server = MCPServer()
-
-        # Create synthesized audio file
-        audio_file = temp_dir / "test_scale.wav"
-        create_test_audio_file(audio_file, audio_type="scale", duration=2.0)
-
-        # Store it in the expected location
-        # Copy file to audio storage
-        import shutil
-        import uuid
 
+        # Synthesize straight into storage under its ID. One second is enough for a
+        # smoke test while staying above the analyzers' minimum duration.
         audio_file_id = str(uuid.uuid4())
-        target_path = temp_dir / f"{audio_file_id}.wav"
-        shutil.copy(audio_file, target_path)
+        create_test_audio_file(
+            storage_paths / f"{audio_file_id}.wav", audio_type="scale", duration=1.0
+        )
 
         # Test tempo analysis
         result = await mcp_server.call_tool("analyze_tempo", audio_file_id=audio_file_id)
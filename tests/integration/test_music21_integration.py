@@ -8,12 +8,30 @@ These tests will be skipped if music21 is not actually used in the implementatio
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+music21 = pytest.importorskip("music21")
+
+from music21 import midi, note, stream  # noqa: E402
+
+from tests.helpers.midi import SINGLE_C4  # noqa: E402
+from zikos.config import settings  # noqa: E402
+from zikos.mcp.tools.processing.midi import MidiTools  # noqa: E402
+from zikos.mcp.tools.processing.midi.midi_parser import midi_text_to_file  # noqa: E402
+
 pytestmark = pytest.mark.integration
 
 
+@pytest.fixture(scope="module")
+def c4_stream():
+    """One-note (C4 quarter) stream shared by the tests that only read or write it"""
+    s = stream.Stream()
+    s.append(note.Note("C4", quarterLength=1.0))
+    return s
+
+
 class TestMusic21Integration:
     """Integration tests for music21 library
 
@@ -24,18 +42,11 @@ class TestMusic21Integration:
     @pytest.mark.asyncio
     async def test_music21_import(self):
         """Test that music21 can be imported"""
-        try:
-            import music21
-
-            assert music21 is not None
-        except ImportError:
-            pytest.skip("music21 not available")
+        assert music21 is not None
 
     @pytest.mark.asyncio
     async def test_midi_validate_with_music21(self, temp_dir):
         """Test MIDI validation using music21 (when implemented)"""
-        from zikos.mcp.tools.processing.midi import MidiTools
-
         tools = MidiTools()
         result = await tools.validate_midi("[MIDI]C4[/MIDI]")
 
@@ -52,109 +63,77 @@ class TestMusic21Integration:
     @pytest.mark.asyncio
     async def test_midi_to_notation_with_music21(self, temp_dir):
         """Test MIDI to notation rendering using music21 (when implemented)"""
-        from unittest.mock import patch
-
-        from zikos.config import settings
-        from zikos.mcp.tools.processing.midi import MidiTools
-        from zikos.mcp.tools.processing.midi.midi_parser import midi_text_to_file
+        with patch.object(settings, "midi_storage_path", temp_dir):
+            with patch.object(settings, "notation_storage_path", temp_dir):
+                tools = MidiTools()
+                with patch.object(tools, "storage_path", temp_dir):
+                    midi_file_id = "test_midi"
+                    midi_path = temp_dir / f"{midi_file_id}.mid"
 
-        try:
-            with patch.object(settings, "midi_storage_path", temp_dir):
-                with patch.object(settings, "notation_storage_path", temp_dir):
-                    tools = MidiTools()
-                    with patch.object(tools, "storage_path", temp_dir):
-                        midi_file_id = "test_midi"
-                        midi_path = temp_dir / f"{midi_file_id}.mid"
-
-                        midi_text = """
-[MIDI]
-Tempo: 120
-Track 1:
-  C4 velocity=60 duration=0.5
-[/MIDI]
-"""
-                        midi_text_to_file(midi_text, midi_path)
+                    midi_text_to_file(SINGLE_C4, midi_path)
 
-                        result = await tools.midi_to_notation(midi_file_id, "both")
+                    result = await tools.midi_to_notation(midi_file_id, "both")
 
-                        assert "midi_file_id" in result
-                        assert "format" in result
+                    assert "midi_file_id" in result
+                    assert "format" in result
 
-                        if "sheet_music_url" in result:
-                            assert isinstance(result["sheet_music_url"], str)
-                        if "tabs_url" in result:
-                            assert isinstance(result["tabs_url"], str)
-        except ImportError:
-            pytest.skip("music21 not available")
+                    if "sheet_music_url" in result:
+                        assert isinstance(result["sheet_music_url"], str)
+                    if "tabs_url" in result:
+                        assert isinstance(result["tabs_url"], str)
 
     @pytest.mark.asyncio
-    async def test_music21_stream_creation(self):
+    async def test_music21_stream_creation(self, c4_stream):
         """Test creating a music21 stream (basic functionality)"""
-        try:
-            from music21 import note, stream
-
-            s = stream.Stream()
-            n = note.Note("C4")
-            s.append(n)
-
-            assert len(s) == 1
-            assert s[0].pitch.name == "C"
-            assert s[0].pitch.octave == 4
-        except ImportError:
-            pytest.skip("music21 not available")
+        assert len(c4_stream) == 1
+        assert c4_stream[0].pitch.name == "C"
+        assert c4_stream[0].pitch.octave == 4
 
     @pytest.mark.asyncio
     async def test_music21_key_detection(self):
         """Test music21 key detection functionality"""
-        try:
-            from music21 import key, note, stream
-
-            s = stream.Stream()
-            for pitch_name in ["C", "E", "G"]:
-                n = note.Note(pitch_name + "4")
-                s.append(n)
+        s = stream.Stream()
+        for pitch_name in ["C", "E", "G"]:
+            n = note.Note(pitch_name + "4")
+            s.append(n)
 
+        try:
             detected_key = s.analyze("key")
-            assert detected_key is not None
-        except ImportError:
-            pytest.skip("music21 not available")
         except AttributeError:
             pytest.skip("music21 key analysis not available in this version")
+        assert detected_key is not None
 
     @pytest.mark.asyncio
-    async def test_music21_midi_export(self, temp_dir):
+    async def test_music21_midi_export(self, temp_dir, c4_stream):
         """Test music21 MIDI export functionality"""
-        try:
-            from music21 import midi, note, stream
+        midi_path = temp_dir / "test_music21.mid"
+        c4_stream.write("midi", fp=str(midi_path))
 
-            s = stream.Stream()
-            n = note.Note("C4", quarterLength=1.0)
-            s.append(n)
+        assert midi_path.exists()
+        assert midi_path.stat().st_size > 0
 
-            midi_path = temp_dir / "test_music21.mid"
-            s.write("midi", fp=str(midi_path))
+    @pytest.mark.asyncio
+    async def test_music21_midi_import(self, temp_dir, c4_stream):
+        """Test music21 MIDI import functionality"""
+        midi_path = temp_dir / "test_import.mid"
+        c4_stream.write("midi", fp=str(midi_path))
 
-            assert midi_path.exists()
-            assert midi_path.stat().st_size > 0
-        except ImportError:
-            pytest.skip("music21 not available")
+        imported = midi.translate.midiFilePathToStream(str(midi_path))
+        assert imported is not None
+        flat = imported.flatten() if hasattr(imported, "flatten") else imported.flat
+        assert len(flat.notes) > 0
 
     @pytest.mark.asyncio
-    async def test_music21_midi_import(self, temp_dir):
-        """Test music21 MIDI import functionality"""
-        try:
-            from music21 import midi, note, stream
+    async def test_midi_roundtrip_fast(self, temp_dir, c4_stream):
+        """Test that a music21-written MIDI file round-trips through symusic"""
+        symusic = pytest.importorskip("symusic")
 
-            s = stream.Stream()
-            n = note.Note("C4", quarterLength=1.0)
-            s.append(n)
+        source_path = temp_dir / "source.mid"
+        c4_stream.write("midi", fp=str(source_path))
 
-            midi_path = temp_dir / "test_import.mid"
-            s.write("midi", fp=str(midi_path))
+        exported_path = temp_dir / "exported.mid"
+        symusic.Score.from_file(str(source_path)).dump_midi(str(exported_path))
 
-            imported = midi.translate.midiFilePathToStream(str(midi_path))
-            assert imported is not None
-            flat = imported.flatten() if hasattr(imported, "flatten") else imported.flat
-            assert len(flat.notes) > 0
-        except ImportError:
-            pytest.skip("music21 not available")
+        reloaded = symusic.Score.from_file(str(exported_path))
+        pitches = [n.pitch for track in reloaded.tracks for n in track.notes]
+        assert pitches == [60]
@@ -74,30 +74,41 @@ class TestWebSocketStreaming:
             assert mock_websocket.send_json.call_count >= 3
 
     @pytest.mark.asyncio
-    async def test_websocket_non_streaming_message(self, mock_websocket, mock_chat_service):
-        """Test WebSocket handles non-streaming messages"""
-        with patch("zikos.api.chat.get_chat_service", return_value=mock_chat_service):
-            call_count = 0
-
-            async def receive_json():
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    return {"type": "message", "message": "Hello", "stream": False}
-                else:
-                    raise WebSocketDisconnect()
+    async def test_websocket_batch(self, mock_websocket, mock_chat_service):
+        """Test one connection serving queued message, audio_ready and cancel frames"""
+        # Queue every scenario on a single connection and drain the replies afterwards
+        mock_websocket.receive_json = AsyncMock(
+            side_effect=[
+                {"type": "message", "message": "Hello", "stream": False, "session_id": "s_plain"},
+                {"type": "message", "message": "Hello", "stream": True, "session_id": "s_stream"},
+                {
+                    "type": "audio_ready",
+                    "audio_file_id": "audio_1",
+                    "recording_id": "rec_1",
+                    "session_id": "s_audio",
+                },
+                {"type": "cancel_recording", "recording_id": "rec_2", "session_id": "s_cancel"},
+                WebSocketDisconnect(),
+            ]
+        )
 
-            mock_websocket.receive_json = receive_json
-
-            try:
-                await websocket_endpoint(mock_websocket)
-            except WebSocketDisconnect:
-                pass
-
-            mock_websocket.accept.assert_called_once()
-            # Should have sent response (may also send error on disconnect)
-            assert mock_websocket.send_json.call_count >= 1
-            mock_chat_service.process_message.assert_called_once()
+        with patch("zikos.api.chat.get_chat_service", return_value=mock_chat_service):
+            await websocket_endpoint(mock_websocket)
+
+        sent = [call.args[0] for call in mock_websocket.send_json.call_args_list]
+        assert sent == [
+            {"type": "response", "message": "Test"},
+            {"type": "session_id", "session_id": "s_stream"},
+            {"type": "token", "content": "Hello"},
+            {"type": "token", "content": " there"},
+            {"type": "response", "message": "Hello there"},
+            {"type": "response", "message": "Audio processed"},
+            {"type": "recording_cancelled", "recording_id": "rec_2"},
+        ]
+        mock_websocket.accept.assert_called_once()
+        mock_chat_service.process_message.assert_called_once_with("Hello", "s_plain")
+        mock_chat_service.handle_audio_ready.assert_called_once_with("audio_1", "rec_1", "s_audio")
+        mock_chat_service.disconnect.assert_called_once_with(mock_websocket)
 
     @pytest.mark.asyncio
     async def test_websocket_streaming_error_handling(self, mock_websocket, mock_chat_service):
@@ -186,3 +197,25 @@ class TestWebSocketStreaming:
                 pass
 
             mock_chat_service.disconnect.assert_called_once_with(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_websocket_unknown_message_type(self, mock_websocket, mock_chat_service):
+        """Test WebSocket answers unknown message types with an error frame"""
+        with patch("zikos.api.chat.get_chat_service", return_value=mock_chat_service):
+            call_count = 0
+
+            async def receive_json():
+                nonlocal call_count
+                call_count += 1
+                if call_count == 1:
+                    return {"type": "not_a_real_type"}
+                else:
+                    raise WebSocketDisconnect()
+
+            mock_websocket.receive_json = receive_json
+
+            await websocket_endpoint(mock_websocket)
+
+            mock_websocket.send_json.assert_called_once_with(
+                {"type": "error", "message": "Unknown message type: not_a_real_type"}
+            )
@@ -1,27 +1,40 @@
 """Unit tests for MIDI API endpoints"""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from fastapi.testclient import TestClient
 
-from zikos.api.midi import router
+from zikos.api.midi import get_midi_service
 from zikos.main import app
 
-app.include_router(router, prefix="/api/midi")
+
+@pytest.fixture(scope="module")
+def midi_service_override():
+    """Substitute a mock MIDI service for the endpoints once for the whole module"""
+    mock = MagicMock()
+    # The awaited methods are built once here; tests only set return values and side effects
+    mock.validate_midi = AsyncMock()
+    mock.synthesize = AsyncMock()
+    mock.render_notation = AsyncMock()
+    mock.get_midi_path = AsyncMock()
+    app.dependency_overrides[get_midi_service] = lambda: mock
+    yield mock
+    app.dependency_overrides.pop(get_midi_service, None)
 
 
 @pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
+def mock_midi_service(midi_service_override):
+    """Mock MIDI service, reset before each test"""
+    midi_service_override.reset_mock(return_value=True, side_effect=True)
+    return midi_service_override
 
 
-@pytest.fixture
-def mock_midi_service():
-    """Mock MIDI service"""
-    with patch("zikos.api.midi.midi_service") as mock:
-        yield mock
+@pytest.fixture(scope="module")
+def fake_midi_file(tmp_path_factory):
+    """Placeholder .mid file for FileResponse, written once per module"""
+    path = tmp_path_factory.mktemp("midi_api") / "test.mid"
+    path.write_bytes(b"fake midi content")
+    return path
 
 
 class TestMidiAPI:
@@ -29,9 +42,12 @@ class TestMidiAPI:
 
     def test_validate_midi_success(self, client, mock_midi_service):
         """Test successful MIDI validation"""
-        mock_midi_service.validate_midi = AsyncMock(
-            return_value={"valid": True, "midi_file_id": "test_midi", "errors": [], "warnings": []}
-        )
+        mock_midi_service.validate_midi.return_value = {
+            "valid": True,
+            "midi_file_id": "test_midi",
+            "errors": [],
+            "warnings": [],
+        }
 
         response = client.post("/api/midi/validate", json={"midi_text": "[MIDI]\n[/MIDI]"})
 
@@ -42,7 +58,7 @@ class TestMidiAPI:
 
     def test_validate_midi_error(self, client, mock_midi_service):
         """Test MIDI validation error handling"""
-        mock_midi_service.validate_midi = AsyncMock(side_effect=ValueError("Invalid MIDI"))
+        mock_midi_service.validate_midi.side_effect = ValueError("Invalid MIDI")
 
         response = client.post("/api/midi/validate", json={"midi_text": "invalid"})
 
@@ -51,7 +67,7 @@ class TestMidiAPI:
 
     def test_synthesize_midi_success(self, client, mock_midi_service):
         """Test successful MIDI synthesis"""
-        mock_midi_service.synthesize = AsyncMock(return_value="test_audio_id")
+        mock_midi_service.synthesize.return_value = "test_audio_id"
 
         response = client.post("/api/midi/test_midi/synthesize?instrument=piano")
 
@@ -61,7 +77,7 @@ class TestMidiAPI:
 
     def test_synthesize_midi_error(self, client, mock_midi_service):
         """Test MIDI synthesis error handling"""
-        mock_midi_service.synthesize = AsyncMock(side_effect=Exception("Synthesis failed"))
+        mock_midi_service.synthesize.side_effect = Exception("Synthesis failed")
 
         response = client.post("/api/midi/test_midi/synthesize?instrument=piano")
 
@@ -70,9 +86,11 @@ class TestMidiAPI:
 
     def test_render_notation_success(self, client, mock_midi_service):
         """Test successful notation rendering"""
-        mock_midi_service.render_notation = AsyncMock(
-            return_value={"midi_file_id": "test_midi", "format": "both", "file_path": "test.xml"}
-        )
+        mock_midi_service.render_notation.return_value = {
+            "midi_file_id": "test_midi",
+            "format": "both",
+            "file_path": "test.xml",
+        }
 
         response = client.post("/api/midi/test_midi/render?format=both")
 
@@ -83,20 +101,16 @@ class TestMidiAPI:
 
     def test_render_notation_error(self, client, mock_midi_service):
         """Test notation rendering error handling"""
-        mock_midi_service.render_notation = AsyncMock(side_effect=Exception("Render failed"))
+        mock_midi_service.render_notation.side_effect = Exception("Render failed")
 
         response = client.post("/api/midi/test_midi/render?format=both")
 
         assert response.status_code == 500
         assert "detail" in response.json()
 
-    def test_get_midi_file_success(self, client, mock_midi_service, temp_dir):
+    def test_get_midi_file_success(self, client, mock_midi_service, fake_midi_file):
         """Test getting MIDI file successfully"""
-        from pathlib import Path
-
-        test_file = temp_dir / "test.mid"
-        test_file.write_bytes(b"fake midi content")
-        mock_midi_service.get_midi_path = AsyncMock(return_value=test_file)
+        mock_midi_service.get_midi_path.return_value = fake_midi_file
 
         response = client.get("/api/midi/test_midi")
 
@@ -106,7 +120,7 @@ class TestMidiAPI:
 
     def test_get_midi_file_not_found(self, client, mock_midi_service):
         """Test getting non-existent MIDI file"""
-        mock_midi_service.get_midi_path = AsyncMock(side_effect=FileNotFoundError("File not found"))
+        mock_midi_service.get_midi_path.side_effect = FileNotFoundError("File not found")
 
         response = client.get("/api/midi/nonexistent")
 
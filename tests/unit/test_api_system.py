@@ -3,21 +3,10 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
-from zikos.api.system import router
-from zikos.main import app
 from zikos.utils.gpu import GpuHint, GpuInfo, HardwareProfile, RamInfo
 from zikos.utils.model_recommendations import ModelRecommendation
 
-app.include_router(router, prefix="/api/system")
-
-
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
-
 
 @pytest.fixture
 def mock_hardware_profile():
@@ -1,11 +1,17 @@
 """Tests for audio preprocessing service"""
 
+import subprocess
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import librosa
+import numpy as np
 import pytest
+import soundfile as sf
+from fastapi import UploadFile
 
+from tests.helpers.audio_synthesis import create_test_audio_file, generate_piano_tone
 from zikos.services.audio_preprocessing import AudioPreprocessingService
 
 
@@ -23,8 +29,6 @@ def preprocessing_service(temp_dir):
 @pytest.fixture
 def sample_wav_file(temp_dir):
     """Create a sample WAV file for testing"""
-    from tests.helpers.audio_synthesis import create_test_audio_file
-
     audio_file = temp_dir / "sample.wav"
     create_test_audio_file(audio_file, audio_type="single_note", duration=1.0)
     return audio_file
@@ -102,8 +106,6 @@ class TestAudioPreprocessingService:
         self, preprocessing_service, sample_wav_file
     ):
         """Test preprocessing handles FFmpeg errors"""
-        import subprocess
-
         with patch("subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, "ffmpeg", stderr="FFmpeg error")
 
@@ -128,8 +130,6 @@ class TestAudioPreprocessingService:
     @pytest.mark.asyncio
     async def test_preprocess_audio_supports_various_formats(self, preprocessing_service, temp_dir):
         """Test preprocessing supports various input formats using real ffmpeg"""
-        from tests.helpers.audio_synthesis import create_test_audio_file
-
         # Create real WAV file and test conversion
         # Note: For full format testing (mp3, flac, etc.), we'd need real files of those formats
         # This test verifies the conversion logic works with a real audio file
@@ -163,21 +163,12 @@ class TestAudioPreprocessingService:
     @pytest.mark.asyncio
     async def test_preprocess_audio_handles_upload_file(self, preprocessing_service, temp_dir):
         """Test preprocessing handles UploadFile objects using real ffmpeg"""
-        from io import BytesIO
-
-        import soundfile as sf
-        from fastapi import UploadFile
-
-        from tests.helpers.audio_synthesis import create_test_audio_file
-
-        # Create real audio data
-        test_audio_file = temp_dir / "source.wav"
-        create_test_audio_file(test_audio_file, audio_type="single_note", duration=1.0)
-
-        # Read it as bytes for UploadFile
-        audio_data = test_audio_file.read_bytes()
+        # Encode real audio straight into the upload buffer, no temp file round-trip
+        audio_buffer = BytesIO()
+        sf.write(audio_buffer, generate_piano_tone(440.0, 1.0), 44100, format="WAV")
+        audio_buffer.seek(0)
         upload_file = UploadFile(
-            filename="test.wav", file=BytesIO(audio_data), headers={"content-type": "audio/wav"}
+            filename="test.wav", file=audio_buffer, headers={"content-type": "audio/wav"}
         )
 
         output_path = await preprocessing_service.preprocess_upload_file(
@@ -191,9 +182,6 @@ class TestAudioPreprocessingService:
     @pytest.mark.asyncio
     async def test_silence_trimmed_from_output(self, preprocessing_service, temp_dir):
         """Preprocessed audio must be shorter than input padded with silence."""
-        import numpy as np
-        import soundfile as sf
-
         sr = 44100
         one_sec_silence = np.zeros(sr, dtype=np.float32)
         tone = (np.sin(2 * np.pi * 440 * np.linspace(0, 1, sr)) * 0.8).astype(np.float32)
@@ -211,9 +199,6 @@ class TestAudioPreprocessingService:
 
     def test_trim_silence_directly(self, preprocessing_service, temp_dir):
         """_trim_silence shortens a file that has leading/trailing silence."""
-        import numpy as np
-        import soundfile as sf
-
         sr = 22050
         silence = np.zeros(sr // 2, dtype=np.float32)
         tone = (np.sin(2 * np.pi * 440 * np.linspace(0, 0.5, sr // 2)) * 0.8).astype(np.float32)
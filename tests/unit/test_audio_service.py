@@ -83,6 +83,85 @@ class TestAudioService:
         assert "pitch" in result
         assert "rhythm" in result
 
+    @pytest.mark.asyncio
+    async def test_run_baseline_analysis_is_cached(self, audio_service, temp_dir):
+        """Test baseline analysis is memoized per file and invalidated on rewrite"""
+        import os
+
+        audio_file_id = "cached_audio"
+        audio_file = temp_dir / f"{audio_file_id}.wav"
+        audio_file.write_bytes(b"fake audio data")
+
+        tools = audio_service.analysis_tools
+        with (
+            patch("zikos.mcp.tools.audio.utils.settings") as mock_settings,
+            patch.object(tools, "analyze_tempo", AsyncMock(return_value={"bpm": 120.0})),
+            patch.object(tools, "detect_pitch", AsyncMock(return_value={"notes": []})),
+            patch.object(tools, "analyze_rhythm", AsyncMock(return_value={"onsets": []})),
+            patch.object(tools, "detect_instrument", AsyncMock(return_value={})),
+        ):
+            mock_settings.audio_storage_path = temp_dir
+
+            first = await audio_service.run_baseline_analysis(audio_file_id)
+            first["tempo"]["bpm"] = 0.0
+            second = await audio_service.run_baseline_analysis(audio_file_id)
+
+            assert second["tempo"] == {"bpm": 120.0}
+            assert tools.analyze_tempo.await_count == 1
+
+            stat = audio_file.stat()
+            os.utime(audio_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            await audio_service.run_baseline_analysis(audio_file_id)
+
+            assert tools.analyze_tempo.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_baseline_analysis_does_not_cache_errors(self, audio_service, temp_dir):
+        """Test a failed analysis is retried on the next request instead of cached"""
+        audio_file_id = "flaky_audio"
+        (temp_dir / f"{audio_file_id}.wav").write_bytes(b"fake audio data")
+
+        tools = audio_service.analysis_tools
+        tempo_results = [{"error": True, "error_type": "PROCESSING_FAILED"}, {"bpm": 120.0}]
+        with (
+            patch("zikos.mcp.tools.audio.utils.settings") as mock_settings,
+            patch.object(tools, "analyze_tempo", AsyncMock(side_effect=tempo_results)),
+            patch.object(tools, "detect_pitch", AsyncMock(return_value={"notes": []})),
+            patch.object(tools, "analyze_rhythm", AsyncMock(return_value={"onsets": []})),
+            patch.object(tools, "detect_instrument", AsyncMock(return_value={})),
+        ):
+            mock_settings.audio_storage_path = temp_dir
+
+            first = await audio_service.run_baseline_analysis(audio_file_id)
+            second = await audio_service.run_baseline_analysis(audio_file_id)
+
+        assert first["tempo"]["error"] is True
+        assert second["tempo"] == {"bpm": 120.0}
+
+    @pytest.mark.asyncio
+    async def test_run_baseline_analysis_decodes_once(self, audio_service, temp_dir):
+        """Test baseline analyzers share a single decode of the recording"""
+        from tests.helpers.audio_synthesis import create_test_audio_file
+        from zikos.mcp.tools.audio.utils import load_audio
+
+        audio_file_id = "decode_once"
+        create_test_audio_file(
+            temp_dir / f"{audio_file_id}.wav", audio_type="single_note", duration=1.0
+        )
+
+        with (
+            patch("zikos.mcp.tools.audio.utils.settings") as mock_settings,
+            patch("zikos.services.audio.load_audio", side_effect=load_audio) as mock_load,
+            patch("librosa.load") as mock_librosa_load,
+        ):
+            mock_settings.audio_storage_path = temp_dir
+            result = await audio_service.run_baseline_analysis(audio_file_id)
+
+        mock_load.assert_called_once()
+        mock_librosa_load.assert_not_called()
+        assert "bpm" in result["tempo"] or "error" in result["tempo"]
+        assert "spectral_centroid_hz" in result["instrument"]
+
     @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_run_baseline_analysis_with_real_audio(self, audio_service, temp_dir):
@@ -146,7 +146,7 @@ class TestPitchDetection:
         """Test pitch detection when no pitch is detected"""
         audio, sr = mock_audio_data
 
-        with patch("librosa.load") as mock_load, patch("librosa.pyin") as mock_pyin:
+        with patch("soundfile.read") as mock_load, patch("librosa.pyin") as mock_pyin:
             mock_load.return_value = (audio, sr)
             # No voiced frames
             f0 = np.array([np.nan] * 100)
@@ -167,7 +167,7 @@ class TestPitchDetection:
         audio, sr = mock_audio_data
 
         with (
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
             patch("librosa.feature.chroma_stft") as mock_chroma,
@@ -193,7 +193,7 @@ class TestPitchDetection:
         audio, sr = mock_audio_data
 
         with (
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
         ):
@@ -326,7 +326,7 @@ class TestRhythmAnalysis:
         audio, sr = mock_audio_data
 
         with (
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.onset.onset_strength") as mock_strength,
             patch("librosa.onset.onset_detect") as mock_onset,
         ):
@@ -377,7 +377,7 @@ class TestRhythmAnalysis:
         audio, sr = mock_audio_data
 
         with (
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.onset.onset_strength") as mock_strength,
             patch("librosa.onset.onset_detect") as mock_onset,
             patch("librosa.beat.beat_track") as mock_beat,
@@ -408,7 +408,7 @@ class TestRhythmAnalysis:
         audio, sr = mock_audio_data
 
         with (
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.onset.onset_strength") as mock_strength,
             patch("librosa.onset.onset_detect") as mock_onset,
         ):
@@ -437,7 +437,7 @@ class TestRhythmAnalysis:
         perfect_frames = np.array([10, 20, 30, 40])
 
         with (
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.onset.onset_strength") as mock_strength,
             patch("librosa.onset.onset_detect") as mock_onset,
             patch("librosa.beat.beat_track") as mock_beat,
@@ -480,6 +480,44 @@ class TestAudioInfo:
         assert "format" in result
         assert "file_size_bytes" in result
 
+    @pytest.mark.asyncio
+    async def test_get_audio_info_reports_header_values(self, audio_tools, sample_audio_file):
+        """Test get_audio_info reports frame count and on-disk file size"""
+        import soundfile as sf
+
+        result = await audio_tools.get_audio_info(audio_path=str(sample_audio_file))
+
+        assert result["frames"] == sf.info(str(sample_audio_file)).frames
+        assert result["file_size_bytes"] == sample_audio_file.stat().st_size
+
+
+class TestLoadAudio:
+    """Tests for the shared audio loader"""
+
+    def test_load_audio_downmixes_stereo_to_float32(self, temp_dir):
+        """Test stereo files are averaged to mono float32 at native rate"""
+        import soundfile as sf
+
+        from zikos.mcp.tools.audio.utils import load_audio
+
+        stereo = np.stack([np.full(1000, 0.5), np.full(1000, -0.25)], axis=1)
+        path = temp_dir / "stereo.wav"
+        sf.write(str(path), stereo, 22050)
+
+        y, sr = load_audio(path)
+
+        assert sr == 22050
+        assert y.dtype == np.float32
+        assert y.shape == (1000,)
+        assert np.allclose(y, 0.125, atol=1e-4)
+
+    def test_load_audio_missing_file(self, temp_dir):
+        """Test missing files raise FileNotFoundError"""
+        from zikos.mcp.tools.audio.utils import load_audio
+
+        with pytest.raises(FileNotFoundError):
+            load_audio(temp_dir / "missing.wav")
+
 
 class TestErrorHandling:
     """Tests for error handling"""
@@ -498,7 +536,7 @@ class TestErrorHandling:
         audio = np.array([0.0] * 5000)  # ~0.23 seconds at 22050 Hz
         sr = 22050
 
-        with patch("librosa.load") as mock_load:
+        with patch("soundfile.read") as mock_load:
             mock_load.return_value = (audio, sr)
 
             # Should handle gracefully, either return error or minimal analysis
@@ -510,7 +548,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_error_handling_processing_failure(self, audio_tools, sample_audio_file):
         """Test error handling for processing failures"""
-        with patch("librosa.load") as mock_load:
+        with patch("soundfile.read") as mock_load:
             mock_load.side_effect = Exception("Processing failed")
 
             # Should return structured error
@@ -638,7 +676,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -680,7 +718,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -728,7 +766,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -775,7 +813,7 @@ class TestComparisonTools:
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
             patch.object(settings, "midi_storage_path", temp_dir),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -821,7 +859,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -856,7 +894,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -894,7 +932,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -934,7 +972,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -974,7 +1012,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -1028,7 +1066,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -1105,7 +1143,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -1160,7 +1198,7 @@ class TestComparisonTools:
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
             patch.object(settings, "midi_storage_path", temp_dir),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -1205,7 +1243,7 @@ class TestComparisonTools:
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
             patch.object(settings, "midi_storage_path", temp_dir),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -1270,7 +1308,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch(
                 "zikos.mcp.tools.audio.tempo.analyze_tempo",
                 side_effect=Exception("Unexpected error"),
@@ -1299,7 +1337,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -1351,7 +1389,7 @@ class TestComparisonTools:
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
             patch.object(settings, "midi_storage_path", temp_dir),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -1401,7 +1439,7 @@ class TestComparisonTools:
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
             patch.object(settings, "midi_storage_path", temp_dir),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch("librosa.beat.beat_track") as mock_beat,
             patch("librosa.pyin") as mock_pyin,
             patch("librosa.onset.onset_detect") as mock_onset,
@@ -1467,7 +1505,7 @@ class TestComparisonTools:
 
         with (
             patch.object(settings, "audio_storage_path", str(temp_dir)),
-            patch("librosa.load") as mock_load,
+            patch("soundfile.read") as mock_load,
             patch(
                 "zikos.mcp.tools.audio.tempo.analyze_tempo",
                 side_effect=Exception("Unexpected error"),
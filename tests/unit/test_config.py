@@ -36,3 +36,20 @@ def test_settings_from_env():
     # Cleanup
     del os.environ["API_PORT"]
     del os.environ["LLM_TEMPERATURE"]
+
+
+@pytest.mark.lightweight
+def test_settings_llama_cpp_tuning_from_env(monkeypatch):
+    """Test llama.cpp tuning settings from environment variables"""
+    monkeypatch.setenv("LLM_N_BATCH", "1024")
+    monkeypatch.setenv("LLM_N_UBATCH", "256")
+    monkeypatch.setenv("LLM_N_THREADS", "6")
+    monkeypatch.setenv("LLM_USE_MLOCK", "true")
+    monkeypatch.setenv("LLM_FLASH_ATTN", "false")
+
+    settings = Settings.from_env()
+    assert settings.llm_n_batch == 1024
+    assert settings.llm_n_ubatch == 256
+    assert settings.llm_n_threads == 6
+    assert settings.llm_use_mlock is True
+    assert settings.llm_flash_attn is False
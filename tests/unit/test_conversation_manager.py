@@ -1,7 +1,10 @@
 """Tests for ConversationManager"""
 
+from unittest.mock import patch
+
 import pytest
 
+from zikos.constants import LLM
 from zikos.services.llm_orchestration.conversation_manager import ConversationManager
 
 
@@ -46,6 +49,55 @@ class TestConversationManager:
         assert len(history1) == 1
         assert len(history2) == 1
 
+    def test_trim_history_keeps_system_and_cuts_on_user_turn(self, manager):
+        """Test trimming drops whole turns and keeps the system prompt"""
+        history = manager.get_history("session_123")
+        for i in range(60):
+            history.append({"role": "user", "content": f"question {i}"})
+            history.append({"role": "assistant", "content": "", "tool_calls": [{"id": str(i)}]})
+            history.append({"role": "tool", "content": "result", "tool_call_id": str(i)})
+
+        with patch.object(LLM, "MAX_HISTORY_MESSAGES", 10):
+            manager.trim_history(history)
+
+        assert history[0]["role"] == "system"
+        assert history[1]["role"] == "user"
+        assert len(history) <= 10
+        assert history[-1]["tool_call_id"] == "59"
+
+    def test_trim_history_char_budget_keeps_latest_turn(self, manager):
+        """Test an oversized latest turn is kept rather than emptied"""
+        history = manager.get_history("session_123")
+        history.append({"role": "user", "content": "old"})
+        history.append({"role": "user", "content": "x" * 100})
+
+        with patch.object(LLM, "MAX_HISTORY_CHARS", 10):
+            manager.trim_history(history)
+
+        assert [msg["role"] for msg in history] == ["system", "user"]
+        assert history[1]["content"] == "x" * 100
+
+    def test_purge_session(self, manager):
+        """Test purging removes history and pending interactions"""
+        manager.get_history("session_123")
+        manager.set_pending_interaction("session_123", "call_1", "request_audio_recording")
+
+        manager.purge_session("session_123")
+
+        assert "session_123" not in manager.conversations
+        assert manager.pop_pending_interaction("session_123") is None
+
+    def test_idle_sessions_expire(self, manager):
+        """Test sessions idle past the TTL are evicted on next access"""
+        with patch("zikos.services.llm_orchestration.conversation_manager.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            manager.get_history("stale")
+            mock_time.monotonic.return_value = LLM.CONVERSATION_TTL_SECONDS + 1
+            manager.get_history("fresh")
+
+        assert "stale" not in manager.conversations
+        assert "fresh" in manager.conversations
+
     def test_get_thinking_for_session_no_session(self, manager):
         """Test getting thinking for non-existent session"""
         result = manager.get_thinking_for_session("nonexistent")
@@ -123,8 +123,10 @@ async def test_analyze_groove_file_not_found(temp_dir):
 @pytest.mark.asyncio
 async def test_analyze_groove_processing_error(temp_dir, sample_audio_path):
     """Test groove analysis with processing error"""
+    sample_audio_path.touch()
+
     with patch.object(settings, "audio_storage_path", str(temp_dir)):
-        with patch("librosa.load", side_effect=Exception("Processing failed")):
+        with patch("soundfile.read", side_effect=Exception("Processing failed")):
             result = await analyze_groove(str(sample_audio_path))
 
     assert result["error"] is True
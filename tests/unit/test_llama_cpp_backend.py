@@ -0,0 +1,149 @@
+"""Tests for the LlamaCppBackend (llama-cpp-python is mocked)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from zikos.services.llm_backends import llama_cpp
+from zikos.services.llm_backends.llama_cpp import LlamaCppBackend
+
+
+@pytest.fixture
+def mock_llama():
+    def make_llm(**kwargs):
+        llm = MagicMock()
+        llm.metadata = {}
+        llm.n_ctx.return_value = kwargs["n_ctx"]
+        return llm
+
+    with patch.object(llama_cpp, "Llama", side_effect=make_llm) as mock:
+        yield mock
+    llama_cpp._LLAMA_CACHE.clear()
+
+
+def _initialize(backend: LlamaCppBackend, tmp_path, n_ctx: int = 4096) -> None:
+    backend.initialize(model_path=str(tmp_path / "model.gguf"), n_ctx=n_ctx, n_gpu_layers=0)
+
+
+def test_same_parameters_share_one_model(mock_llama, tmp_path):
+    first, second = LlamaCppBackend(), LlamaCppBackend()
+    _initialize(first, tmp_path)
+    _initialize(second, tmp_path)
+
+    assert mock_llama.call_count == 1
+    assert first.llm is second.llm
+    assert first._inference_lock is second._inference_lock
+
+
+def test_different_parameters_load_separately(mock_llama, tmp_path):
+    first, second = LlamaCppBackend(), LlamaCppBackend()
+    _initialize(first, tmp_path, n_ctx=4096)
+    _initialize(second, tmp_path, n_ctx=2048)
+
+    assert mock_llama.call_count == 2
+    assert first.llm is not second.llm
+
+
+def test_model_freed_when_last_backend_closes(mock_llama, tmp_path):
+    first, second = LlamaCppBackend(), LlamaCppBackend()
+    _initialize(first, tmp_path)
+    _initialize(second, tmp_path)
+    llm = first.llm
+
+    first.close()
+    llm.close.assert_not_called()
+    assert second.is_initialized()
+
+    second.close()
+    llm.close.assert_called_once()
+    assert not llama_cpp._LLAMA_CACHE
+
+
+@pytest.mark.asyncio
+async def test_cancelled_stream_holds_lock_until_worker_returns(mock_llama, tmp_path):
+    import asyncio
+    import threading
+
+    backend = LlamaCppBackend()
+    _initialize(backend, tmp_path)
+    decoding = threading.Event()
+    release = threading.Event()
+
+    def chunks():
+        yield {"choices": [{"delta": {"content": "a"}}]}
+        decoding.set()
+        release.wait(timeout=5)
+        yield {"choices": [{"delta": {"content": "b"}}]}
+
+    backend.llm.create_chat_completion.return_value = chunks()
+
+    async def consume():
+        async for _ in backend.stream_chat_completion([{"role": "user", "content": "hi"}]):
+            pass
+
+    task = asyncio.create_task(consume())
+    await asyncio.to_thread(decoding.wait, 5)
+    task.cancel()
+    await asyncio.sleep(0.05)
+
+    assert backend._inference_lock.locked()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not backend._inference_lock.locked()
+
+
+def test_shared_model_lock_works_across_event_loops(mock_llama, tmp_path):
+    import asyncio
+
+    first, second = LlamaCppBackend(), LlamaCppBackend()
+    _initialize(first, tmp_path)
+    _initialize(second, tmp_path)
+    first.llm.create_chat_completion.side_effect = lambda **_: iter(
+        [{"choices": [{"delta": {"content": "a"}}]}]
+    )
+
+    async def contend():
+        async def consume(backend):
+            return [c async for c in backend.stream_chat_completion([{"role": "user"}])]
+
+        return await asyncio.gather(consume(first), consume(second))
+
+    # Each run contends on the shared lock from a fresh loop, as throwaway
+    # asyncio.run calls (fixtures, scripts) do alongside the server's loop
+    for _ in range(2):
+        assert [len(chunks) for chunks in asyncio.run(contend())] == [1, 1]
+    assert not first._inference_lock.locked()
+
+
+def test_quantized_kv_cache_falls_back_to_f16(tmp_path):
+    import sys
+    from types import SimpleNamespace
+
+    def make_llm(**kwargs):
+        if "type_v" in kwargs:
+            raise ValueError("Failed to create llama_context")
+        llm = MagicMock()
+        llm.metadata = {}
+        llm.n_ctx.return_value = kwargs["n_ctx"]
+        return llm
+
+    fake_module = SimpleNamespace(llama_cpp=SimpleNamespace(GGML_TYPE_Q8_0=8))
+    with (
+        patch.dict(sys.modules, {"llama_cpp": fake_module}),
+        patch.object(llama_cpp, "Llama", side_effect=make_llm) as mock,
+    ):
+        backend = LlamaCppBackend()
+        backend.initialize(
+            model_path=str(tmp_path / "model.gguf"),
+            n_ctx=4096,
+            n_gpu_layers=0,
+            flash_attn=True,
+            kv_cache_type="q8_0",
+        )
+    llama_cpp._LLAMA_CACHE.clear()
+
+    assert backend.is_initialized()
+    assert mock.call_count == 2
+    assert mock.call_args_list[0].kwargs["type_v"] == 8
+    assert "type_v" not in mock.call_args_list[1].kwargs
@@ -66,6 +66,14 @@ class TestSystemPrompt:
         prompt = llm_service._get_system_prompt(prompt_file_path=tmp_path / "NONEXISTENT.md")
         assert "expert music teacher" in prompt.lower()
 
+    def test_default_prompt_loaded_once(self, llm_service):
+        with patch("zikos.services.llm.CorePromptSection") as mock_section:
+            first = llm_service._get_system_prompt()
+            second = llm_service._get_system_prompt()
+
+        mock_section.assert_not_called()
+        assert first == second
+
 
 class TestConversationHistory:
     def test_new_session_has_system_prompt(self, llm_service):
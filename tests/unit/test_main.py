@@ -1,17 +1,8 @@
 """Tests for main application"""
 
-import pytest
-from fastapi.testclient import TestClient
-
 from zikos.main import app
 
 
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
-
-
 class TestMain:
     """Tests for main application"""
 
@@ -30,7 +21,7 @@ class TestMain:
         response = client.get("/health")
         assert response.status_code == 200
         data = response.json()
-        assert "status" in data
+        assert data["status"] == "healthy"
 
     def test_root_endpoint_no_index(self, client):
         """Test root endpoint when index.html doesn't exist"""
@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from zikos.mcp.tools.analysis import AudioAnalysisTools
@@ -24,9 +25,9 @@ async def test_analyze_tempo(temp_dir, sample_audio_path):
 
     tools = AudioAnalysisTools()
 
-    with patch("librosa.load") as mock_load:
+    with patch("soundfile.read") as mock_load:
         # Generate 2 seconds of audio at 22050 Hz (enough to pass duration check)
-        mock_load.return_value = ([0.0] * 44100, 22050)
+        mock_load.return_value = (np.zeros(44100, dtype=np.float32), 22050)
         with patch("librosa.beat.beat_track") as mock_beat:
             mock_beat.return_value = (120.0, [0, 5512, 11025])
 
@@ -39,40 +40,28 @@ async def test_analyze_tempo(temp_dir, sample_audio_path):
 
 @pytest.mark.asyncio
 @pytest.mark.integration
-async def test_analyze_tempo_with_real_audio(temp_dir):
+async def test_analyze_tempo_with_real_audio(storage_paths):
     """Test tempo analysis with real synthesized audio"""
-    from pathlib import Path
+    import uuid
 
     from tests.helpers.audio_synthesis import create_test_audio_file
-    from zikos.config import settings
-    from zikos.mcp.tools.audio.utils import resolve_audio_path
-
-    # Create synthesized rhythmic audio
-    audio_file = temp_dir / "test_rhythm.wav"
-    create_test_audio_file(audio_file, audio_type="rhythm", duration=5.0, tempo=120.0)
-
-    # Store in expected location
-    import shutil
-    import uuid
 
+    # Synthesize straight into the patched audio storage under its ID
     audio_file_id = str(uuid.uuid4())
-    target_path = temp_dir / f"{audio_file_id}.wav"
-    shutil.copy(audio_file, target_path)
-
-    try:
-        tools = AudioAnalysisTools()
-        result = await tools.analyze_tempo(audio_file_id=audio_file_id)
-
-        assert isinstance(result, dict)
-        # Should have BPM or error
-        assert "bpm" in result or "error" in result
-        if "bpm" in result:
-            # BPM should be reasonable (not 0 or negative)
-            assert result["bpm"] > 0
-            assert result["bpm"] < 300  # Reasonable upper bound
-    finally:
-        if target_path.exists():
-            target_path.unlink()
+    create_test_audio_file(
+        storage_paths / f"{audio_file_id}.wav", audio_type="rhythm", duration=5.0, tempo=120.0
+    )
+
+    tools = AudioAnalysisTools()
+    result = await tools.analyze_tempo(audio_file_id=audio_file_id)
+
+    assert isinstance(result, dict)
+    # Should have BPM or error
+    assert "bpm" in result or "error" in result
+    if "bpm" in result:
+        # BPM should be reasonable (not 0 or negative)
+        assert result["bpm"] > 0
+        assert result["bpm"] < 300  # Reasonable upper bound
 
 
 @pytest.mark.asyncio
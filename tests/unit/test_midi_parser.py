@@ -48,6 +48,14 @@ class TestParseNoteLine:
         assert result["velocity"] == 90
         assert result["duration"] == 0.75
 
+    def test_parse_note_attributes_any_order(self):
+        """Test parsing note with attributes in reverse order and tab separators"""
+        result = parse_note_line("Bb3\tduration=2.0  velocity=100")
+        assert result is not None
+        assert result["note"] == "Bb3"
+        assert result["velocity"] == 100
+        assert result["duration"] == 2.0
+
     def test_parse_empty_line(self):
         """Test parsing empty line"""
         result = parse_note_line("")
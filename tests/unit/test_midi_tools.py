@@ -144,3 +144,268 @@ Track 1:
         """Test call_tool with unknown tool"""
         with pytest.raises(ValueError, match="Unknown tool"):
             await midi_tools.call_tool("unknown_tool", arg1="test")
+
+    @pytest.mark.asyncio
+    async def test_synthesize_with_pyfluidsynth_schedules_overlapping_notes(
+        self, midi_tools, temp_dir
+    ):
+        """Test pyfluidsynth synthesis renders chords as simultaneous note events"""
+        import sys
+        from unittest.mock import MagicMock, patch
+
+        import numpy as np
+        import soundfile as sf
+
+        from zikos.config import settings
+        from zikos.mcp.tools.processing.midi.midi_parser import midi_text_to_file
+
+        calls: list[tuple] = []
+
+        class FakeSynth:
+            def start(self):
+                pass
+
+            def sfload(self, path):
+                return 1
+
+            def program_select(self, channel, sfid, bank, program):
+                pass
+
+            def noteon(self, channel, pitch, velocity):
+                calls.append(("on", pitch))
+
+            def noteoff(self, channel, pitch):
+                calls.append(("off", pitch))
+
+            def get_samples(self, length):
+                calls.append(("render", length))
+                return np.full(2 * length, 1000, dtype=np.int16)
+
+            def delete(self):
+                pass
+
+        midi_path = temp_dir / "chord.mid"
+        midi_text_to_file(
+            """
+[MIDI]
+Tempo: 120
+Track 1:
+  C4 velocity=80 duration=1.0
+Track 2:
+  E4 velocity=80 duration=1.0
+[/MIDI]
+""",
+            midi_path,
+        )
+
+        fake_module = MagicMock(Synth=FakeSynth)
+        with (
+            patch.dict(sys.modules, {"fluidsynth": fake_module}),
+            patch.object(settings, "audio_storage_path", temp_dir),
+        ):
+            result = await midi_tools._synthesize_with_pyfluidsynth(
+                midi_path, temp_dir / "fake.sf2", "piano"
+            )
+
+        assert [c for c in calls if c[0] == "on"] == [("on", 60), ("on", 64)]
+        assert calls.index(("on", 64)) < calls.index(("render", 22050))
+        assert result["duration"] == pytest.approx(0.5)
+
+        audio, sample_rate = sf.read(str(temp_dir / f"{result['audio_file_id']}.wav"))
+        assert sample_rate == 44100
+        assert audio.shape == (22050, 2)
+
+    @pytest.mark.asyncio
+    async def test_synthesize_with_pyfluidsynth_follows_tempo_changes(self, midi_tools, temp_dir):
+        """Test note times follow every tempo mark and zero-length notes are skipped"""
+        import sys
+        from unittest.mock import MagicMock, patch
+
+        import numpy as np
+        from music21 import note, stream, tempo
+
+        from zikos.config import settings
+        from zikos.mcp.tools.processing.midi import midi_collection
+
+        events: list[tuple] = []
+        rendered = [0]
+
+        class FakeSynth:
+            def start(self):
+                pass
+
+            def sfload(self, path):
+                return 1
+
+            def program_select(self, channel, sfid, bank, program):
+                pass
+
+            def noteon(self, channel, pitch, velocity):
+                events.append(("on", pitch, rendered[0]))
+
+            def noteoff(self, channel, pitch):
+                events.append(("off", pitch, rendered[0]))
+
+            def get_samples(self, length):
+                rendered[0] += length
+                return np.zeros(2 * length, dtype=np.int16)
+
+            def delete(self):
+                pass
+
+        score = stream.Stream()
+        score.insert(0, tempo.MetronomeMark(number=120))
+        score.insert(0, note.Note("C4", quarterLength=1.0))
+        score.insert(0, note.Note("E4", quarterLength=0.0))
+        score.insert(1, tempo.MetronomeMark(number=60))
+        score.insert(1, note.Note("D4", quarterLength=1.0))
+
+        midi_path = temp_dir / "tempo.mid"
+        midi_path.write_bytes(b"not parsed")
+
+        midi_collection._note_events.cache_clear()
+        fake_module = MagicMock(Synth=FakeSynth)
+        with (
+            patch.dict(sys.modules, {"fluidsynth": fake_module}),
+            patch.object(settings, "audio_storage_path", temp_dir),
+            patch.object(midi_collection, "_parse_midi_stream", return_value=score),
+        ):
+            result = await midi_tools._synthesize_with_pyfluidsynth(
+                midi_path, temp_dir / "fake.sf2", "piano"
+            )
+
+        assert events == [
+            ("on", 60, 0),
+            ("off", 60, 22050),
+            ("on", 62, 22050),
+            ("off", 62, 66150),
+        ]
+        assert result["duration"] == pytest.approx(1.5)
+
+    @pytest.mark.asyncio
+    async def test_midi_to_notation_reuses_rendered_sheet(self, midi_tools, temp_dir):
+        """Test repeated notation renders of an unchanged file parse and lay it out once"""
+        from unittest.mock import patch
+
+        from zikos.mcp.tools.processing.midi import midi_collection
+        from zikos.mcp.tools.processing.midi.midi_parser import midi_text_to_file
+
+        midi_text_to_file(
+            """
+[MIDI]
+Tempo: 120
+Track 1:
+  C4 velocity=60 duration=1.0
+  E4 velocity=60 duration=1.0
+[/MIDI]
+""",
+            temp_dir / "cached.mid",
+        )
+
+        midi_collection._parse_midi_stream.cache_clear()
+        midi_collection._render_sheet_svg.cache_clear()
+        with (
+            patch.object(midi_tools, "storage_path", temp_dir),
+            patch.object(midi_collection.settings, "notation_storage_path", temp_dir),
+        ):
+            first = await midi_tools.midi_to_notation("cached", "sheet_music")
+            second = await midi_tools.midi_to_notation("cached", "both")
+
+        assert first["sheet_music_url"] == second["sheet_music_url"]
+        assert midi_collection._parse_midi_stream.cache_info().misses == 1
+        render_info = midi_collection._render_sheet_svg.cache_info()
+        assert render_info.misses == 1
+        assert render_info.hits == 1
+        assert (temp_dir / "sheet_cached.svg").stat().st_size > 0
+
+    def test_note_events_are_derived_once(self, temp_dir):
+        """Test the timed notes of an unchanged file are parsed and derived once"""
+        from zikos.mcp.tools.processing.midi import midi_collection
+        from zikos.mcp.tools.processing.midi.midi_parser import midi_text_to_file
+
+        midi_path = temp_dir / "events.mid"
+        midi_text_to_file(
+            """
+[MIDI]
+Tempo: 120
+Track 1:
+  C4 velocity=60 duration=1.0
+[/MIDI]
+""",
+            midi_path,
+        )
+
+        midi_collection._parse_midi_stream.cache_clear()
+        midi_collection._note_events.cache_clear()
+        first = midi_collection._load_note_events(midi_path)
+        second = midi_collection._load_note_events(midi_path)
+
+        assert first is second
+        assert midi_collection._parse_midi_stream.cache_info().misses == 1
+        assert [(pitches, velocity) for _, _, pitches, velocity in first] == [((60,), 60)]
+        assert first[0][1] == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_midi_to_notation_tabs_only_skips_rendering(self, midi_tools, temp_dir):
+        """Test tabs-only notation reports the limitation without parsing or rendering"""
+        from unittest.mock import patch
+
+        from zikos.mcp.tools.processing.midi import midi_collection
+
+        (temp_dir / "tabs_only.mid").write_bytes(b"not parsed")
+
+        with (
+            patch.object(midi_tools, "storage_path", temp_dir),
+            patch.object(midi_collection.settings, "notation_storage_path", temp_dir),
+            patch.object(midi_collection, "_render_sheet_svg") as mock_render,
+        ):
+            result = await midi_tools.midi_to_notation("tabs_only", "tabs")
+
+        mock_render.assert_not_called()
+        assert "tabs_error" in result
+        assert "sheet_music_url" not in result
+        assert not (temp_dir / "sheet_tabs_only.svg").exists()
+
+    def test_find_soundfont_caches_found_path(self, midi_tools, temp_dir):
+        """Test a found SoundFont is cached while a miss is rescanned"""
+        from unittest.mock import patch
+
+        soundfont = temp_dir / "test.sf2"
+        with patch.object(
+            midi_tools, "_scan_for_soundfont", side_effect=[None, soundfont]
+        ) as mock_scan:
+            assert midi_tools._find_soundfont() is None
+            assert midi_tools._find_soundfont() == soundfont
+            assert midi_tools._find_soundfont() == soundfont
+
+        assert mock_scan.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_synthesize_with_cli_renders_into_storage(self, midi_tools, temp_dir):
+        """Test the CLI path writes the WAV directly to audio storage"""
+        from unittest.mock import MagicMock, patch
+
+        import numpy as np
+        import soundfile as sf
+
+        from zikos.config import settings
+
+        def fake_run(cmd, **kwargs):
+            output_path = cmd[cmd.index("-F") + 1]
+            sf.write(output_path, np.zeros((44100, 2), dtype=np.float32), 44100)
+            return MagicMock(returncode=0, stderr="")
+
+        with (
+            patch.object(midi_tools, "_find_fluidsynth_cli", return_value="fluidsynth"),
+            patch.object(settings, "audio_storage_path", temp_dir),
+            patch("subprocess.run", side_effect=fake_run) as mock_run,
+        ):
+            result = await midi_tools._synthesize_with_cli(
+                temp_dir / "song.mid", temp_dir / "font.sf2", "piano"
+            )
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[cmd.index("-F") + 1] == str(temp_dir / f"{result['audio_file_id']}.wav")
+        assert cmd[cmd.index("-r") + 1] == "44100"
+        assert result["duration"] == pytest.approx(1.0)
+        assert result["midi_file_id"] == "song"
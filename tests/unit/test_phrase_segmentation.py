@@ -145,7 +145,7 @@ async def test_segment_phrases_processing_failure(temp_dir, sample_audio_path):
     sf.write(str(sample_audio_path), y, sample_rate)
 
     with patch.object(settings, "audio_storage_path", str(temp_dir)):
-        with patch("librosa.load", side_effect=Exception("Processing error")):
+        with patch("soundfile.read", side_effect=Exception("Processing error")):
             result = await segment_phrases(str(sample_audio_path))
 
     assert result["error"] is True
@@ -1,5 +1,7 @@
 """Tests for ToolExecutor"""
 
+import json
+from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
@@ -7,7 +9,7 @@ import pytest
 from zikos.mcp.server import MCPServer
 from zikos.mcp.tool import ToolCategory
 from zikos.services.llm_orchestration.tool_call_parser import get_tool_call_parser
-from zikos.services.llm_orchestration.tool_executor import ToolExecutor
+from zikos.services.llm_orchestration.tool_executor import ToolExecutor, serialize_tool_result
 
 
 @pytest.fixture
@@ -239,3 +241,22 @@ class TestEnhanceFileNotFoundError:
     def test_other_tool_returns_plain_error(self, tool_executor):
         result = tool_executor._enhance_file_not_found_error("analyze_tempo", "File not found")
         assert result == "Error: File not found"
+
+
+class TestSerializeToolResult:
+    def test_dict_becomes_compact_json(self):
+        content = serialize_tool_result({"bpm": 120.0, "stable": True, "notes": None})
+        assert json.loads(content) == {"bpm": 120.0, "stable": True, "notes": None}
+        assert " " not in content
+
+    def test_string_passes_through(self):
+        assert serialize_tool_result("done") == "done"
+
+    def test_unserializable_values_use_str(self):
+        content = serialize_tool_result({"path": Path("/tmp/a.wav")})
+        assert json.loads(content) == {"path": "/tmp/a.wav"}
+
+    def test_values_orjson_rejects_fall_back_to_json(self):
+        content = serialize_tool_result({(0, 4): "C4", "samples": 2**70})
+        assert json.loads(content) == {"(0, 4)": "C4", "samples": 2**70}
+        assert content.startswith('{"(0, 4)":"C4",')